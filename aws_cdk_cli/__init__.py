@@ -16,23 +16,45 @@ License:
 """
 
 import os
-import platform
-import subprocess
 import json
 import logging
+import functools
+from collections import namedtuple
+from dataclasses import dataclass
 from .version import __version__
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+# Use orjson for metadata parsing when the optional "fast" extra is installed
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
-# Platform detection
-SYSTEM = platform.system().lower()
-MACHINE = platform.machine().lower()
+def _install_cache(func):
+    """Memoize a lookup of installed components for the life of the process.
+
+    Setting AWS_CDK_CLI_NO_CACHE=1 bypasses the cache, which helps when
+    components are reinstalled underneath a running process during development.
+    The wrapped function keeps the cache's cache_clear() for invalidation.
+    """
+    cached = functools.cache(func)
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        if os.environ.get("AWS_CDK_CLI_NO_CACHE") == "1":
+            return func(*args)
+        return cached(*args)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
 
 
 # More robust platform detection
+@functools.cache
 def detect_platform() -> tuple[str, str]:
     """Detect the current platform and architecture more robustly.
 
@@ -40,25 +62,11 @@ def detect_platform() -> tuple[str, str]:
         A tuple of (system, machine) where system is one of 'darwin', 'linux', 'windows'
         and machine is one of 'x86_64', 'arm64'.
     """
-    system = SYSTEM
-    machine = MACHINE
-
-    # Normalize system names
-    if system.startswith("darwin"):
-        system = "darwin"
-    elif system.startswith("linux"):
-        system = "linux"
-    elif system.startswith("win"):
-        system = "windows"
-
-    # Normalize machine architecture
-    if machine in ("amd64", "x86_64", "x64"):
-        machine = "x86_64"
-    elif machine in ("arm64", "aarch64", "armv8"):
-        # Important: Always use 'arm64' for consistency with Node.js distributions
-        # This is a critical change to standardize on one directory name
-        machine = "arm64"
+    # Normalized from sys.platform and os.uname() without importing platform
+    from .constants import MACHINE as machine
+    from .constants import SYSTEM as system
 
+    if machine == "arm64":
         # Still store both names in environment for compatibility
         os.environ["AWS_CDK_CLI_ARM64"] = "arm64"
         os.environ["AWS_CDK_CLI_AARCH64"] = "aarch64"
@@ -78,66 +86,96 @@ NODE_BINARIES_DIR = os.path.join(PACKAGE_DIR, "node_binaries")
 NODE_PLATFORM_DIR = os.path.join(NODE_BINARIES_DIR, SYSTEM, MACHINE)
 
 
-# Function to find the Node.js version directory
-def _find_node_version_dir():
-    """Find the Node.js version directory inside the platform directory."""
-    if not os.path.exists(NODE_PLATFORM_DIR):
-        return None
-
-    # Look for directories that match the node-v* pattern
-    for item in os.listdir(NODE_PLATFORM_DIR):
-        if item.startswith("node-v") and os.path.isdir(
-            os.path.join(NODE_PLATFORM_DIR, item)
-        ):
-            return item
+_NodePaths = namedtuple(
+    "_NodePaths",
+    [
+        "node_version_dir",
+        "node_bin_path",
+        "node_bin_dir",
+        "node_candidates",
+        "cdk_script_path",
+        "licenses",
+    ],
+)
+
+# Module attributes resolved lazily from _resolve_node_paths() (PEP 562)
+_LAZY_PATH_ATTRS = {
+    "_NODE_VERSION_DIR": "node_version_dir",
+    "NODE_BIN_PATH": "node_bin_path",
+    "NODE_BIN_DIR": "node_bin_dir",
+    "CDK_SCRIPT_PATH": "cdk_script_path",
+    "LICENSES": "licenses",
+}
 
-    return None
 
+@_install_cache
+def _resolve_node_paths() -> _NodePaths:
+    """Resolve the Node.js, CDK script and license paths on first use.
 
-# Node.js binary path
-if SYSTEM == "windows":
-    _NODE_VERSION_DIR = _find_node_version_dir()
-    if _NODE_VERSION_DIR:
-        # Windows Node.js ZIP has the executable in the root of the extracted folder
-        NODE_BIN_PATH = os.path.join(NODE_PLATFORM_DIR, _NODE_VERSION_DIR, "node.exe")
+    Returns:
+        A _NodePaths tuple for the current platform.
+    """
+    from .runtime import iter_candidate_node_paths, list_node_version_dirs
+
+    # Scan the platform directory once for both the version dir and candidates
+    version_dirs = list_node_version_dirs(NODE_PLATFORM_DIR)
+    node_version_dir = version_dirs[0] if version_dirs else None
+    node_candidates = (
+        tuple(iter_candidate_node_paths(NODE_PLATFORM_DIR, version_dirs))
+        if version_dirs is not None
+        else ()
+    )
+
+    # Node.js binary path
+    if SYSTEM == "windows":
+        if node_version_dir:
+            # Windows Node.js ZIP has the executable in the root of the extracted folder
+            node_bin_path = os.path.join(
+                NODE_PLATFORM_DIR, node_version_dir, "node.exe"
+            )
+        else:
+            # Without a node-v* directory the only known layout is a direct node.exe
+            node_bin_path = os.path.join(NODE_PLATFORM_DIR, "node.exe")
     else:
-        # Check both possible locations for the Windows executable
-        direct_path = os.path.join(NODE_PLATFORM_DIR, "node.exe")
-        if os.path.exists(direct_path):
-            NODE_BIN_PATH = direct_path
+        if node_version_dir:
+            node_bin_path = os.path.join(
+                NODE_PLATFORM_DIR, node_version_dir, "bin", "node"
+            )
         else:
-            # We'll need to find the executable in extracted subdirectories
-            for root, dirs, files in os.walk(NODE_PLATFORM_DIR):
-                if "node.exe" in files:
-                    NODE_BIN_PATH = os.path.join(root, "node.exe")
-                    break
-            else:
-                # Fallback to the default location if not found
-                NODE_BIN_PATH = os.path.join(NODE_PLATFORM_DIR, "node.exe")
-else:
-    _NODE_VERSION_DIR = _find_node_version_dir()
-    if _NODE_VERSION_DIR:
-        NODE_BIN_PATH = os.path.join(
-            NODE_PLATFORM_DIR, _NODE_VERSION_DIR, "bin", "node"
-        )
+            node_bin_path = os.path.join(NODE_PLATFORM_DIR, "bin", "node")
+
+    # CDK script path
+    if SYSTEM == "windows":
+        # On Windows, the CDK script is named 'cdk.cmd'
+        cdk_script_path = os.path.join(NODE_MODULES_DIR, "aws-cdk", "bin", "cdk.cmd")
+        # If cdk.cmd doesn't exist, fall back to 'cdk'
+        if not os.path.exists(cdk_script_path):
+            cdk_script_path = os.path.join(NODE_MODULES_DIR, "aws-cdk", "bin", "cdk")
     else:
-        NODE_BIN_PATH = os.path.join(NODE_PLATFORM_DIR, "bin", "node")
-
-# CDK script path
-if SYSTEM == "windows":
-    # On Windows, the CDK script is named 'cdk.cmd'
-    CDK_SCRIPT_PATH = os.path.join(NODE_MODULES_DIR, "aws-cdk", "bin", "cdk.cmd")
-    # If cdk.cmd doesn't exist, fall back to 'cdk'
-    if not os.path.exists(CDK_SCRIPT_PATH):
-        CDK_SCRIPT_PATH = os.path.join(NODE_MODULES_DIR, "aws-cdk", "bin", "cdk")
-else:
-    CDK_SCRIPT_PATH = os.path.join(NODE_MODULES_DIR, "aws-cdk", "bin", "cdk")
-
-# License paths
-LICENSES = {
-    "aws_cdk": os.path.join(NODE_MODULES_DIR, "aws-cdk", "LICENSE"),
-    "node": os.path.join(NODE_PLATFORM_DIR, "LICENSE"),
-}
+        cdk_script_path = os.path.join(NODE_MODULES_DIR, "aws-cdk", "bin", "cdk")
+
+    # License paths
+    licenses = {
+        "aws_cdk": os.path.join(NODE_MODULES_DIR, "aws-cdk", "LICENSE"),
+        "node": os.path.join(NODE_PLATFORM_DIR, "LICENSE"),
+    }
+
+    return _NodePaths(
+        node_version_dir,
+        node_bin_path,
+        os.path.dirname(node_bin_path),
+        node_candidates,
+        cdk_script_path,
+        licenses,
+    )
+
+
+def __getattr__(name: str):
+    """Materialize path attributes such as NODE_BIN_PATH on first access."""
+    field = _LAZY_PATH_ATTRS.get(name)
+    if field is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(_resolve_node_paths(), field)
 
 
 def is_cdk_installed() -> bool:
@@ -146,7 +184,7 @@ def is_cdk_installed() -> bool:
     Returns:
         True if the CDK script exists in the expected location, False otherwise.
     """
-    return os.path.exists(CDK_SCRIPT_PATH)
+    return runtime_state().cdk_path is not None
 
 
 def _find_node_binary() -> str | None:
@@ -155,34 +193,67 @@ def _find_node_binary() -> str | None:
     This is a pure function with no side effects. It searches for the node
     binary in the expected locations based on the platform.
 
-    Uses the shared find_node_in_directory() implementation from runtime.py
-    to avoid code duplication.
+    Uses the candidate paths collected by _resolve_node_paths() and the shared
+    first_node_binary() check from runtime.py to avoid code duplication.
 
     Returns:
         The path to the node binary if found, None otherwise.
     """
+    paths = _resolve_node_paths()
+
     # First check the computed NODE_BIN_PATH
-    if os.path.exists(NODE_BIN_PATH) and os.path.getsize(NODE_BIN_PATH) > 0:
-        return NODE_BIN_PATH
+    if os.path.exists(paths.node_bin_path) and os.path.getsize(paths.node_bin_path) > 0:
+        return paths.node_bin_path
+
+    # Fall back to the other known layouts in the platform directory
+    from .runtime import first_node_binary
+
+    return first_node_binary(paths.node_candidates)
+
+
+@dataclass(frozen=True)
+class RuntimeState:
+    """Locations of the bundled runtime components, None when not installed."""
 
-    # Use the shared implementation to search in the platform directory
-    from .runtime import find_node_in_directory
+    node_path: str | None
+    cdk_path: str | None
 
-    return find_node_in_directory(NODE_PLATFORM_DIR)
+
+@_install_cache
+def runtime_state() -> RuntimeState:
+    """Get the bundled runtime state, computed once per process.
+
+    Call invalidate_runtime_state() after installing or removing components.
+
+    Returns:
+        The cached RuntimeState.
+    """
+    cdk_script_path = _resolve_node_paths().cdk_script_path
+    return RuntimeState(
+        node_path=_find_node_binary(),
+        cdk_path=cdk_script_path if os.path.exists(cdk_script_path) else None,
+    )
+
+
+def invalidate_runtime_state() -> None:
+    """Discard the cached runtime state so the next check re-scans the disk."""
+    _resolve_node_paths.cache_clear()
+    runtime_state.cache_clear()
+    get_cdk_version.cache_clear()
+    get_node_version.cache_clear()
+    get_license_text.cache_clear()
 
 
 def is_node_installed() -> bool:
     """Check if Node.js is installed in the package directory.
 
-    This is a pure predicate function with no side effects.
-    It does not modify any global state.
-
     Returns:
         True if a valid Node.js binary is found, False otherwise.
     """
-    return _find_node_binary() is not None
+    return runtime_state().node_path is not None
 
 
+@_install_cache
 def get_cdk_version() -> str | None:
     """Get the installed CDK version.
 
@@ -195,27 +266,36 @@ def get_cdk_version() -> str | None:
 
     # Try to get version from metadata file first
     metadata_path = os.path.join(NODE_MODULES_DIR, "aws-cdk", "metadata.json")
-    if os.path.exists(metadata_path):
-        try:
-            with open(metadata_path, "r") as f:
-                metadata = json.load(f)
-                return metadata.get("cdk_version")
-        except (IOError, json.JSONDecodeError) as e:
-            logger.debug(f"Failed to read CDK metadata: {e}")
+    try:
+        with open(metadata_path, "rb") as f:
+            return _json_loads(f.read()).get("cdk_version")
+    except FileNotFoundError:
+        pass
+    except (IOError, json.JSONDecodeError) as e:
+        logger.debug(f"Failed to read CDK metadata: {e}")
 
     # Fallback to package.json
+    package_json_path = os.path.join(NODE_MODULES_DIR, "aws-cdk", "package.json")
     try:
-        package_json_path = os.path.join(NODE_MODULES_DIR, "aws-cdk", "package.json")
-        if os.path.exists(package_json_path):
-            with open(package_json_path, "r") as f:
-                data = json.load(f)
-                return data.get("version")
+        with open(package_json_path, "rb") as f:
+            return _json_loads(f.read()).get("version")
+    except FileNotFoundError:
+        pass
     except (IOError, json.JSONDecodeError) as e:
         logger.debug(f"Failed to read CDK package.json: {e}")
 
     return None
 
 
+def _version_from_dir_name(dir_name: str) -> str | None:
+    """Extract the version from a node-v<version>-<os>-<arch> directory name."""
+    version = dir_name.removeprefix("node-v").split("-", 1)[0]
+    if all(part.isdigit() for part in version.split(".")):
+        return version
+    return None
+
+
+@_install_cache
 def get_node_version() -> str | None:
     """Get the installed Node.js version.
 
@@ -228,30 +308,41 @@ def get_node_version() -> str | None:
 
     # Try to get version from metadata file first
     metadata_path = os.path.join(NODE_PLATFORM_DIR, "metadata.json")
-    if os.path.exists(metadata_path):
-        try:
-            with open(metadata_path, "r") as f:
-                metadata = json.load(f)
-                return metadata.get("node_version")
-        except (IOError, json.JSONDecodeError) as e:
-            logger.debug(f"Failed to read Node.js metadata: {e}")
+    try:
+        with open(metadata_path, "rb") as f:
+            return _json_loads(f.read()).get("node_version")
+    except FileNotFoundError:
+        pass
+    except (IOError, json.JSONDecodeError) as e:
+        logger.debug(f"Failed to read Node.js metadata: {e}")
+
+    # Official archives extract to node-v<version>-<os>-<arch>, so the version
+    # can be read from the directory name without starting Node.js
+    paths = _resolve_node_paths()
+    if (
+        paths.node_version_dir
+        and runtime_state().node_path == paths.node_bin_path
+        and (version := _version_from_dir_name(paths.node_version_dir))
+    ):
+        return version
 
     # Fallback to running node --version
+    import subprocess
+
     try:
-        if os.path.exists(NODE_BIN_PATH):
-            version = subprocess.check_output(
-                [NODE_BIN_PATH, "--version"], text=True
-            ).strip()
-            # Remove the 'v' prefix if present
-            if version.startswith("v"):
-                version = version[1:]
-            return version
+        version = subprocess.check_output(
+            [paths.node_bin_path, "--version"], text=True
+        ).strip()
+        # Remove the 'v' prefix if present
+        version = version.removeprefix("v")
+        return version
     except (subprocess.SubprocessError, OSError) as e:
         logger.debug(f"Failed to get Node.js version: {e}")
 
     return None
 
 
+@_install_cache
 def get_license_text(component: str) -> str | None:
     """Get the license text for a component.
 
@@ -261,26 +352,31 @@ def get_license_text(component: str) -> str | None:
     Returns:
         The license text as a string if found, None otherwise.
     """
-    license_path = LICENSES.get(component)
-    if license_path and os.path.exists(license_path):
-        try:
-            with open(license_path, "r", encoding="utf-8") as f:
-                return f.read()
-        except IOError as e:
-            logger.debug(f"Failed to read license for {component}: {e}")
+    license_path = _resolve_node_paths().licenses.get(component)
+    if not license_path:
+        return None
+    try:
+        with open(license_path, "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+    except IOError as e:
+        logger.debug(f"Failed to read license for {component}: {e}")
     return None
 
 
 # Print diagnostic info in debug mode
 if os.environ.get("AWS_CDK_DEBUG") == "1":
-    logger.info(f"AWS CDK Python Wrapper v{__version__}")
-    logger.info(f"Platform: {SYSTEM}-{MACHINE}")
-    if is_node_installed():
-        logger.info(f"Node.js: v{get_node_version()} installed")
-    else:
-        logger.info("Node.js: Not installed")
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("AWS CDK Python Wrapper v%s", __version__)
+        logger.info("Platform: %s-%s", SYSTEM, MACHINE)
+        if is_node_installed():
+            logger.info("Node.js: v%s installed", get_node_version())
+        else:
+            logger.info("Node.js: Not installed")
 
-    if is_cdk_installed():
-        logger.info(f"AWS CDK: v{get_cdk_version()} installed")
-    else:
-        logger.info("AWS CDK: Not installed")
+        if is_cdk_installed():
+            logger.info("AWS CDK: v%s installed", get_cdk_version())
+        else:
+            logger.info("AWS CDK: Not installed")
@@ -4,44 +4,130 @@ Command-line interface for AWS CDK Python wrapper with Node.js runtime support.
 """
 
 import os
+import stat
 import sys
-import subprocess
+import functools
 import logging
-import argparse
-from . import runtime
 from . import version
 from .constants import NODE_VERSION
-import shutil
 import re
-from typing import List, Tuple, Optional, Union
+from collections.abc import Iterator
 
 from aws_cdk_cli import (
     __version__,
-    get_license_text,
     is_node_installed,
     get_cdk_version,
     get_node_version,
-    NODE_BIN_PATH,
-    CDK_SCRIPT_PATH,
+    invalidate_runtime_state,
+    _resolve_node_paths,
     SYSTEM,
     MACHINE,
 )
-from aws_cdk_cli.installer import setup_nodejs
 
-# Configure logging
-logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
 
+# Environment defaults for every CDK invocation
+_BASE_CDK_ENV = {"CDK_DISABLE_VERSION_CHECK": "1"}
+
+# CDK's upgrade recommendation banner; the substring is a cheap prefilter
+_UPGRADE_SUBSTR = "npm install -g aws-cdk"
+_UPGRADE_RE = re.compile(r"^\*\*\*.*npm install -g aws-cdk.*\*\*\*")
+_UPGRADE_LINE_RE = re.compile(
+    r"^\*\*\*.*npm install -g aws-cdk.*\*\*\*.*(?:\n|$)", re.MULTILINE
+)
+
+# Flags handled by the wrapper itself, mapped to their option names; every
+# other argument is passed through to the CDK CLI untouched
+_WRAPPER_FLAGS = {
+    "--wrapper-version": "wrapper_version",
+    "--use-system-node": "use_system_node",
+    "--use-bun": "use_bun",
+    "--use-downloaded-node": "use_downloaded_node",
+    "--show-node-warnings": "show_node_warnings",
+    "--create-node-symlink": "create_node_symlink",
+    "--verbose": "verbose",
+    "-v": "verbose",
+}
+
+
 def should_filter(line: str) -> bool:
     """Return True if the line should be filtered out (upgrade recommendation)."""
-    upgrade_pattern = re.compile(r"^\*\*\*.*npm install -g aws-cdk.*\*\*\*")
-    return "npm install -g aws-cdk" in line and upgrade_pattern.match(line) is not None
+    return _UPGRADE_SUBSTR in line and _UPGRADE_RE.match(line) is not None
+
+
+def _strip_upgrade_lines(output: str) -> str:
+    """Remove upgrade messages from captured output, without a trailing newline."""
+    if _UPGRADE_SUBSTR in output:
+        output = _UPGRADE_LINE_RE.sub("", output)
+    return output.removesuffix("\n")
+
+
+def _pump_filtered(source, sink) -> None:
+    """Copy lines from source to sink as they arrive, dropping upgrade messages."""
+    write = sink.write
+    for line in source:
+        if not should_filter(line):
+            write(line)
+
+
+def _split_wrapper_args(argv: list[str]) -> tuple[set[str], list[str]]:
+    """
+    Split command-line arguments into wrapper options and CDK arguments.
+
+    Anything after a bare "--" is always passed through to CDK.
+
+    Args:
+        argv: Command-line arguments, without the program name
+
+    Returns:
+        Tuple of (set of wrapper option names, remaining CDK arguments)
+    """
+    flags = set()
+    remaining = []
+    for i, arg in enumerate(argv):
+        if arg == "--":
+            remaining.extend(argv[i:])
+            break
+        name = _WRAPPER_FLAGS.get(arg)
+        if name is None:
+            remaining.append(arg)
+        else:
+            flags.add(name)
+    return flags, remaining
+
+
+def _can_exec_replace() -> bool:
+    """Return True if the CDK process may replace the current one via exec.
+
+    Exec cannot filter output, so it is only used when the upgrade filter is
+    disabled, and never on Windows where exec does not replace the process.
+    It is also limited to an interactive terminal: when stdout is piped the
+    caller is more likely another program that expects this call to return.
+    """
+    return (
+        SYSTEM != "windows"
+        and os.environ.get("AWS_CDK_CLI_DISABLE_UPGRADE_FILTER") == "1"
+        and sys.stdout.isatty()
+    )
+
+
+def _env_already_ok(env: dict | None, node_bin_dir: str) -> bool:
+    """Return True if the current environment can be passed to CDK unchanged.
+
+    That is the case when there are no overrides, CDK_DISABLE_VERSION_CHECK
+    is already set and the Node.js bin directory already leads PATH.
+    """
+    return (
+        not env
+        and "CDK_DISABLE_VERSION_CHECK" in os.environ
+        and os.environ.get("PATH", "").split(os.pathsep, 1)[0] == node_bin_dir
+    )
 
 
 def run_cdk_command(
-    args: List[str], capture_output: bool = False, env: Optional[dict] = None
-) -> Union[int, Tuple[int, str, str]]:
+    args: list[str], capture_output: bool = False, env: dict | None = None
+) -> int | tuple[int, str, str]:
     """
     Run a CDK command with the given arguments using downloaded Node.js.
 
@@ -52,9 +138,19 @@ def run_cdk_command(
 
     Returns:
         The exit code from the CDK command, or a tuple of (exit_code, stdout, stderr) if capture_output is True.
+
+    Note:
+        With AWS_CDK_CLI_DISABLE_UPGRADE_FILTER=1 on POSIX, capture_output
+        False and stdout a terminal, the current process is replaced by
+        Node.js and this function does not return.
     """
+    import subprocess
+    import threading
+
     # Ensure Node.js and CDK are installed
     if not is_node_installed():
+        from aws_cdk_cli.installer import setup_nodejs
+
         logger.info("Node.js is not installed. Setting up...")
         success, result = setup_nodejs()
         if not success:
@@ -65,59 +161,74 @@ def run_cdk_command(
             if capture_output:
                 return 1, "", error_msg
             return 1
+        invalidate_runtime_state()
+
+    # Resolve the paths now, so an install made above is picked up
+    paths = _resolve_node_paths()
+    node_bin_path = paths.node_bin_path
+    node_bin_dir = paths.node_bin_dir
 
     # Construct the command: node cdk.js [args]
     # The correct way to execute the CDK CLI is to run the script through Node.js
-    cmd = [NODE_BIN_PATH, CDK_SCRIPT_PATH] + args
-
-    # Set up environment variables
-    if env is None:
-        env = {}
+    cmd = [node_bin_path, paths.cdk_script_path] + args
 
-    # Merge with current environment
-    process_env = os.environ.copy()
-    process_env.update(env)
-
-    # Always disable CDK version check unless user explicitly overrides
-    if "CDK_DISABLE_VERSION_CHECK" not in process_env:
-        process_env["CDK_DISABLE_VERSION_CHECK"] = "1"
-
-    # Add PATH to ensure Node.js can find any needed binaries
-    node_bin_dir = os.path.dirname(NODE_BIN_PATH)
-    if "PATH" in process_env:
-        process_env["PATH"] = node_bin_dir + os.pathsep + process_env["PATH"]
+    if _env_already_ok(env, node_bin_dir):
+        # Inherit the current environment as-is (None means no copy)
+        process_env = None
     else:
-        process_env["PATH"] = node_bin_dir
+        # Merge defaults, the current environment and overrides in a single pass;
+        # the version check stays disabled unless the user explicitly overrides it
+        process_env = {**_BASE_CDK_ENV, **os.environ, **(env or {})}
+
+        # Add PATH to ensure Node.js can find any needed binaries; an empty
+        # PATH is replaced rather than extended, which would add the cwd
+        path = process_env.get("PATH")
+        process_env["PATH"] = node_bin_dir + os.pathsep + path if path else node_bin_dir
 
     try:
         # Execute the CDK command
         if capture_output:
+            # Nobody can answer prompts while output is captured, so give
+            # CDK an empty stdin instead of letting it block on ours
             process = subprocess.run(
-                cmd, capture_output=True, text=True, env=process_env
+                cmd,
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                env=process_env,
             )
-            # Filter out upgrade recommendation lines using the optimized check
-            filtered_stdout = [
-                line for line in process.stdout.splitlines() if not should_filter(line)
-            ]
-            filtered_stderr = [
-                line for line in process.stderr.splitlines() if not should_filter(line)
-            ]
+            # Drop upgrade recommendation lines from the whole buffer in one pass
             return (
                 process.returncode,
-                "\n".join(filtered_stdout),
-                "\n".join(filtered_stderr),
+                _strip_upgrade_lines(process.stdout),
+                _strip_upgrade_lines(process.stderr),
             )
+        elif _can_exec_replace():
+            # Nothing to filter: hand the process over to Node.js entirely
+            sys.stdout.flush()
+            sys.stderr.flush()
+            if process_env is None:
+                os.execv(node_bin_path, cmd)
+            else:
+                os.execve(node_bin_path, cmd, process_env)
         else:
-            # Pass through stdin/stdout/stderr, but filter upgrade messages
-            process = subprocess.run(
-                cmd, capture_output=True, text=True, env=process_env
-            )
-            for line in process.stdout.splitlines():
-                if not should_filter(line):
-                    print(line)
-            for line in process.stderr.splitlines():
-                if not should_filter(line):
-                    print(line, file=sys.stderr)
+            # Stream stdout/stderr as they arrive, filtering upgrade messages
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                env=process_env,
+            ) as process:
+                stderr_pump = threading.Thread(
+                    target=_pump_filtered,
+                    args=(process.stderr, sys.stderr),
+                    daemon=True,
+                )
+                stderr_pump.start()
+                _pump_filtered(process.stdout, sys.stdout)
+                stderr_pump.join()
             return process.returncode
     except subprocess.SubprocessError as e:
         error_msg = f"Error executing CDK command: {e}"
@@ -133,6 +244,15 @@ def run_cdk_command(
         return 1
 
 
+def _has_license(component: str) -> bool:
+    """Return True if a non-empty license file exists for the component."""
+    license_path = _resolve_node_paths().licenses.get(component)
+    try:
+        return bool(license_path) and os.stat(license_path).st_size > 0
+    except OSError:
+        return False
+
+
 def show_versions(verbose=False):
     """
     Show version information for the wrapper, CDK, and Node.js.
@@ -162,12 +282,14 @@ def show_versions(verbose=False):
 
     if verbose:
         print("\nInstallation Paths:")
-        print(f"  Node.js binary: {NODE_BIN_PATH}")
-        print(f"  CDK script: {CDK_SCRIPT_PATH}")
+        paths = _resolve_node_paths()
+        print(f"  Node.js binary: {paths.node_bin_path}")
+        print(f"  CDK script: {paths.cdk_script_path}")
 
-        # Check if licenses are available
-        aws_cdk_license = get_license_text("aws_cdk")
-        node_license = get_license_text("node")
+        # Check if licenses are available; only their presence is reported,
+        # so there is no need to read them
+        aws_cdk_license = _has_license("aws_cdk")
+        node_license = _has_license("node")
 
         if aws_cdk_license or node_license:
             print("\nLicense Information:")
@@ -177,92 +299,87 @@ def show_versions(verbose=False):
                 print("  Node.js: MIT License")
 
 
-def create_node_symlink():
+def _stat_exec(path: str) -> os.stat_result | None:
+    """Stat path and return the result if the current user may execute it.
+
+    A single stat answers both existence and executability. Like the kernel,
+    only the execute bit of the owner, group or other class that applies to
+    the effective user counts; root may execute with any of them set.
     """
-    Create a symlink to the Node.js binary in a suitable directory in the user's PATH.
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not hasattr(os, "geteuid"):
+        # Windows derives the execute bits from the file extension
+        mask = 0o111
+    elif (euid := os.geteuid()) == 0:
+        mask = 0o111
+    elif st.st_uid == euid:
+        mask = stat.S_IXUSR
+    elif st.st_gid == os.getegid() or st.st_gid in os.getgroups():
+        mask = stat.S_IXGRP
+    else:
+        mask = stat.S_IXOTH
+    return st if st.st_mode & mask else None
 
-    This function tries to create a symlink in the following locations, in priority order:
-    1. Virtual environment bin directories
-    2. Local .venv directories in current working directory
-    3. User-specific directories (~/.local/bin, ~/bin)
-    4. System directories (/usr/local/bin, /usr/bin) for root users
-    5. Script's parent directory as fallback
 
-    Returns:
-        bool: True if symlink was created successfully, False otherwise
-    """
-    logger.debug("Creating Node.js symlink")
+@functools.cache
+def _is_executable(path: str) -> bool:
+    """Check (once per path) whether path exists and is executable."""
+    return _stat_exec(path) is not None
 
-    # Find Node.js binary
-    node_binary = None
+
+def _iter_node_binary_candidates() -> Iterator[str]:
+    """Yield possible Node.js binaries for the symlink, in priority order."""
+    from . import runtime
 
     # Try to get the node path from runtime module
     try:
         node_path = runtime.get_node_path()
-        if node_path and os.path.exists(node_path) and os.access(node_path, os.X_OK):
-            node_binary = node_path
-            logger.debug(f"Found Node.js binary via runtime: {node_binary}")
+        if node_path:
+            logger.debug("Checking Node.js binary via runtime: %s", node_path)
+            yield node_path
     except OSError as e:
-        logger.debug(f"Error getting Node.js path from runtime: {e}")
+        logger.debug("Error getting Node.js path from runtime: %s", e)
 
     # Check NODE_BIN_PATH as fallback
-    if (
-        not node_binary
-        and os.path.exists(NODE_BIN_PATH)
-        and os.access(NODE_BIN_PATH, os.X_OK)
-    ):
-        node_binary = NODE_BIN_PATH
-        logger.debug(f"Found Node.js binary via NODE_BIN_PATH: {node_binary}")
+    yield _resolve_node_paths().node_bin_path
 
     # Check cache directory
-    if not node_binary:
-        logger.debug("Looking for Node.js binary in cache and other locations")
-        cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "aws-cdk-cli")
-        cached_binary = os.path.join(cache_dir, f"node-v{NODE_VERSION}", "bin", "node")
-        if os.path.exists(cached_binary) and os.access(cached_binary, os.X_OK):
-            node_binary = cached_binary
-            logger.debug(f"Found Node.js binary in cache: {node_binary}")
-
-    # If still not found, search for it in the node_binaries directory using shared logic
-    if not node_binary:
-        logger.debug("Searching for Node.js binary in node_binaries directory")
-        node_binaries_dir = os.path.join(os.path.dirname(__file__), "node_binaries")
-        platform_dir = os.path.join(node_binaries_dir, SYSTEM, MACHINE)
-        node_binary = runtime.find_node_in_directory(platform_dir)
-        if node_binary:
-            logger.debug(f"Found Node.js binary via shared search: {node_binary}")
-
-    # Check if we found a valid Node.js binary
-    if not node_binary:
-        logger.error("Could not find Node.js binary")
-        return False
+    logger.debug("Looking for Node.js binary in cache and other locations")
+    cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "aws-cdk-cli")
+    yield os.path.join(cache_dir, f"node-v{NODE_VERSION}", "bin", "node")
 
-    # Determine potential bin directories in priority order
-    bin_dirs = []
+    # The other known layouts in node_binaries, scanned once per process
+    logger.debug("Searching for Node.js binary in node_binaries directory")
+    yield from _resolve_node_paths().node_candidates
 
-    # 1. Virtual environment bin directory
-    if hasattr(sys, "prefix") and sys.prefix != sys.base_prefix:
-        if SYSTEM == "windows":
-            venv_bin_dir = os.path.join(sys.prefix, "Scripts")
-        else:
-            venv_bin_dir = os.path.join(sys.prefix, "bin")
 
+def _iter_symlink_dirs() -> Iterator[str]:
+    """Yield directories to place the Node.js symlink in, in priority order.
+
+    Directories are only probed (or created) once the previous ones have failed.
+    """
+    # 1. Virtual environment bin directory
+    if sys.prefix != sys.base_prefix:
+        venv_bin_dir = os.path.join(
+            sys.prefix, "Scripts" if SYSTEM == "windows" else "bin"
+        )
         if os.path.exists(venv_bin_dir):
-            bin_dirs.append(venv_bin_dir)
-            logger.debug(f"Found virtual environment bin directory: {venv_bin_dir}")
+            logger.debug("Found virtual environment bin directory: %s", venv_bin_dir)
+            yield venv_bin_dir
 
     # 2. Look for .venv directory in current working directory
     local_venv_bin = os.path.join(
         os.getcwd(), ".venv", "bin" if SYSTEM != "windows" else "Scripts"
     )
     if os.path.exists(local_venv_bin):
-        bin_dirs.append(local_venv_bin)
-        logger.debug(f"Found local .venv bin directory: {local_venv_bin}")
+        logger.debug("Found local .venv bin directory: %s", local_venv_bin)
+        yield local_venv_bin
 
     # 3. User-specific directories
     home_dir = os.path.expanduser("~")
-    user_bin_dirs = []
-
     if SYSTEM != "windows":
         user_bin_dirs = [
             os.path.join(home_dir, ".local", "bin"),
@@ -277,38 +394,69 @@ def create_node_symlink():
         ]
 
     for user_bin in user_bin_dirs:
-        if os.path.exists(user_bin) and os.access(user_bin, os.W_OK):
-            bin_dirs.append(user_bin)
-            logger.debug(f"Found user bin directory: {user_bin}")
-        elif not os.path.exists(user_bin):
-            try:
-                os.makedirs(user_bin, exist_ok=True)
-                bin_dirs.append(user_bin)
-                logger.debug(f"Created user bin directory: {user_bin}")
-            except (OSError, PermissionError) as e:
-                logger.debug(f"Could not create user bin directory {user_bin}: {e}")
-
-    # 4. Check for root user and add system directories
-    is_root = os.geteuid() == 0 if hasattr(os, "geteuid") else False
-    if is_root:
+        if os.path.exists(user_bin):
+            if os.access(user_bin, os.W_OK):
+                logger.debug("Found user bin directory: %s", user_bin)
+                yield user_bin
+            continue
+        try:
+            os.makedirs(user_bin, exist_ok=True)
+        except OSError as e:
+            logger.debug("Could not create user bin directory %s: %s", user_bin, e)
+            continue
+        logger.debug("Created user bin directory: %s", user_bin)
+        yield user_bin
+
+    # 4. System directories, only writable for the root user
+    if hasattr(os, "geteuid") and os.geteuid() == 0:
         logger.debug("Running as root user, checking system bin directories")
         for system_bin in ["/usr/local/bin", "/usr/bin"]:
             if os.path.exists(system_bin) and os.access(system_bin, os.W_OK):
-                bin_dirs.append(system_bin)
-                logger.debug(f"Found writable system bin directory: {system_bin}")
+                logger.debug("Found writable system bin directory: %s", system_bin)
+                yield system_bin
 
     # 5. Script directory as last resort
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    bin_dirs.append(script_dir)
-    logger.debug(f"Added script directory as fallback: {script_dir}")
+    logger.debug("Using script directory as fallback: %s", script_dir)
+    yield script_dir
+
+
+def create_node_symlink():
+    """
+    Create a symlink to the Node.js binary in a suitable directory in the user's PATH.
+
+    This function tries to create a symlink in the following locations, in priority order:
+    1. Virtual environment bin directories
+    2. Local .venv directories in current working directory
+    3. User-specific directories (~/.local/bin, ~/bin)
+    4. System directories (/usr/local/bin, /usr/bin) for root users
+    5. Script's parent directory as fallback
+
+    Returns:
+        bool: True if symlink was created successfully, False otherwise
+    """
+    import shutil
+
+    logger.debug("Creating Node.js symlink")
+    _is_executable.cache_clear()
+
+    # Find Node.js binary
+    node_binary = next(
+        (path for path in _iter_node_binary_candidates() if _is_executable(path)),
+        None,
+    )
+    if not node_binary:
+        logger.error("Could not find Node.js binary")
+        return False
+    logger.debug("Using Node.js binary: %s", node_binary)
 
     # Try each bin directory in order
-    for bin_dir in bin_dirs:
+    for bin_dir in _iter_symlink_dirs():
         # Determine target path
         target_path = os.path.join(
             bin_dir, "node.exe" if SYSTEM == "windows" else "node"
         )
-        logger.debug(f"Attempting to create symlink at: {target_path}")
+        logger.debug("Attempting to create symlink at: %s", target_path)
 
         try:
             # Remove existing symlink if it exists (use lexists to detect broken symlinks)
@@ -317,28 +465,32 @@ def create_node_symlink():
                     os.unlink(target_path)
                 else:
                     os.remove(target_path)
-                logger.debug(f"Removed existing node binary at {target_path}")
+                logger.debug("Removed existing node binary at %s", target_path)
 
             # Create symlink or copy the binary
             if SYSTEM == "windows":
-                # Windows: copy the binary instead of symlink
-                shutil.copy2(node_binary, target_path)
-                logger.debug(f"Copied Node.js binary to {target_path}")
+                # Windows: symlinks need Developer Mode or admin rights, so use
+                # a hard link and only copy the binary as a last resort (e.g.
+                # across volumes)
+                try:
+                    os.link(node_binary, target_path)
+                    logger.debug("Hard-linked Node.js binary to %s", target_path)
+                except (OSError, NotImplementedError):
+                    shutil.copy2(node_binary, target_path)
+                    logger.debug("Copied Node.js binary to %s", target_path)
             else:
                 # Unix: create a symlink
                 os.symlink(node_binary, target_path)
                 # Set executable permissions
                 os.chmod(target_path, 0o755)
-                logger.debug(f"Created symlink from {node_binary} to {target_path}")
+                logger.debug("Created symlink from %s to %s", node_binary, target_path)
 
             # Verify that the binary exists and is executable
-            if os.path.exists(target_path) and (
-                SYSTEM == "windows" or os.access(target_path, os.X_OK)
-            ):
-                logger.info(f"Node.js symlink created at {target_path}")
+            if _stat_exec(target_path) is not None:
+                logger.info("Node.js symlink created at %s", target_path)
                 return True
         except (OSError, PermissionError, shutil.Error) as e:
-            logger.debug(f"Failed to create Node.js symlink in {bin_dir}: {e}")
+            logger.debug("Failed to create Node.js symlink in %s: %s", bin_dir, e)
             continue  # Try the next directory
 
     logger.error("Failed to create Node.js symlink in any directory")
@@ -351,60 +503,22 @@ def main():
 
     Parses arguments and passes them to the actual CDK CLI.
     """
-    # Parse the arguments
-    parser = argparse.ArgumentParser(
-        description="AWS CDK CLI",
-        add_help=False,  # We'll pass --help to CDK CLI
-    )
+    # Split off the wrapper's own flags, the rest will be passed to CDK CLI
+    flags, remaining = _split_wrapper_args(sys.argv[1:])
 
-    # Add version argument
-    parser.add_argument(
-        "--wrapper-version",
-        action="store_true",
-        help="Print the version of the Python wrapper",
-    )
-
-    # Add JavaScript runtime control arguments
-    runtime_control = parser.add_argument_group("JavaScript Runtime Options")
-    runtime_control.add_argument(
-        "--use-system-node",
-        action="store_true",
-        help="Use system Node.js installation if available and compatible",
-    )
-    runtime_control.add_argument(
-        "--use-bun",
-        action="store_true",
-        help="Use Bun as the JavaScript runtime (requires Bun v1.1.0+)",
-    )
-    runtime_control.add_argument(
-        "--use-downloaded-node",
-        action="store_true",
-        help="Use the downloaded Node.js instead of system Node.js",
-    )
-    runtime_control.add_argument(
-        "--show-node-warnings",
-        action="store_true",
-        help="Show Node.js version compatibility warnings (hidden by default)",
-    )
-    runtime_control.add_argument(
-        "--create-node-symlink",
-        action="store_true",
-        help="Create a symlink to the Node.js binary in a suitable directory",
-    )
-
-    # Add verbose mode
-    parser.add_argument(
-        "--verbose",
-        "-v",
-        action="store_true",
-        help="Show verbose output",
-    )
+    # Handle --wrapper-version before setting anything else up
+    if "wrapper_version" in flags:
+        print(f"AWS CDK Python Wrapper v{version.__version__}")
+        print(f"Downloaded CDK v{version.__cdk_version__}")
+        print(f"Downloaded Node.js v{version.__node_version__}")
+        return 0
 
-    # Parse known arguments, the rest will be passed to CDK CLI
-    args, remaining = parser.parse_known_args()
+    from . import runtime
 
-    # Setup logging level
-    if args.verbose:
+    # Setup logging; configured here rather than at import so library users
+    # keep control of their own logging setup
+    logging.basicConfig(format="%(levelname)s: %(message)s")
+    if "verbose" in flags:
         logging.root.setLevel(logging.DEBUG)
         logging.getLogger("aws_cdk_cli").setLevel(logging.DEBUG)
     else:
@@ -412,34 +526,27 @@ def main():
         logging.root.setLevel(logging.WARNING)
         logging.getLogger("aws_cdk_cli").setLevel(logging.WARNING)
 
-    # Handle --wrapper-version
-    if args.wrapper_version:
-        print(f"AWS CDK Python Wrapper v{version.__version__}")
-        print(f"Downloaded CDK v{version.__cdk_version__}")
-        print(f"Downloaded Node.js v{version.__node_version__}")
-        return 0
-
     # If runtime control options are provided, set them as environment vars
     # so they can be passed to the installer/runtime modules
-    if args.use_system_node:
+    if "use_system_node" in flags:
         os.environ["AWS_CDK_CLI_USE_SYSTEM_NODE"] = "1"
         logger.debug("Using system Node.js if available")
 
-    if args.use_bun:
+    if "use_bun" in flags:
         os.environ["AWS_CDK_CLI_USE_BUN"] = "1"
         logger.debug("Using Bun as JavaScript runtime if available")
 
-    if args.use_downloaded_node:
+    if "use_downloaded_node" in flags:
         os.environ["AWS_CDK_CLI_USE_DOWNLOADED_NODE"] = "1"
         logger.debug("Using downloaded Node.js")
 
-    if args.show_node_warnings:
+    if "show_node_warnings" in flags:
         os.environ["AWS_CDK_CLI_SHOW_NODE_WARNINGS"] = "1"
         logger.debug("Showing Node.js version compatibility warnings")
 
     # Handle explicit Node.js symlink creation
     if (
-        args.create_node_symlink
+        "create_node_symlink" in flags
         or os.environ.get("AWS_CDK_CLI_CREATE_NODE_SYMLINK") == "1"
     ):
         if create_node_symlink():
@@ -449,21 +556,21 @@ def main():
             return 1
 
         # If only creating symlink, return here
-        if args.create_node_symlink and len(remaining) == 0:
+        if "create_node_symlink" in flags and len(remaining) == 0:
             return 0
 
     # Check for incompatible combinations
-    if args.use_system_node and args.use_downloaded_node:
+    if "use_system_node" in flags and "use_downloaded_node" in flags:
         logger.warning(
             "Both --use-system-node and --use-downloaded-node specified. Using system Node.js takes precedence."
         )
 
-    if args.use_bun and args.use_downloaded_node:
+    if "use_bun" in flags and "use_downloaded_node" in flags:
         logger.warning(
             "Both --use-bun and --use-downloaded-node specified. Bun will be tried first."
         )
 
-    if args.use_bun and args.use_system_node:
+    if "use_bun" in flags and "use_system_node" in flags:
         logger.warning(
             "Both --use-bun and --use-system-node specified. Bun will be tried first."
         )
@@ -4,27 +4,94 @@ Shared constants for aws-cdk-cli package.
 This module centralizes all constants to avoid duplication across modules.
 """
 
+import functools
 import os
-import platform
+import sys
 
 # Node.js version to use (LTS)
 NODE_VERSION = "22.22.2"
 
+# Lowest Node.js version accepted, whatever CDK's package.json allows
+MIN_NODE_VERSION = "22.0.0"
+
 # Minimum Bun version required for --eval support
 MIN_BUN_VERSION = "1.1.0"
 
+# Normalization tables for sys.platform and the raw machine name
+_SYSTEM_NAMES = {"darwin": "darwin", "linux": "linux", "win32": "windows"}
+_MACHINE_NAMES = {
+    "amd64": "x86_64",
+    "x86_64": "x86_64",
+    "x64": "x86_64",
+    # Always use arm64 for consistency with Node.js
+    "arm64": "arm64",
+    "aarch64": "arm64",
+    "armv8": "arm64",
+}
+
+
+def _raw_machine() -> str:
+    """
+    Get the machine architecture without importing the platform module.
+
+    Returns:
+        Lowercase machine name as reported by the OS (e.g. x86_64, aarch64, amd64)
+    """
+    if hasattr(os, "uname"):
+        return os.uname().machine.lower()
+
+    # Windows; PROCESSOR_ARCHITEW6432 is set for 32-bit Python on 64-bit Windows
+    machine = os.environ.get("PROCESSOR_ARCHITEW6432") or os.environ.get(
+        "PROCESSOR_ARCHITECTURE"
+    )
+    if machine:
+        return machine.lower()
+
+    import platform
+
+    return platform.machine().lower()
+
+
 # Platform detection
-SYSTEM = platform.system().lower()
-MACHINE = platform.machine().lower()
+SYSTEM = _SYSTEM_NAMES.get(sys.platform, sys.platform)
+MACHINE = _MACHINE_NAMES.get(_machine := _raw_machine(), _machine)
 
-# Normalize machine architecture
-if MACHINE in ("amd64", "x86_64"):
-    MACHINE = "x86_64"
-elif MACHINE in ("arm64", "aarch64"):
-    # Always use arm64 for consistency with Node.js
-    MACHINE = "arm64"
+# Node.js distribution names for our normalized platform identifiers
+_NODE_DIST_SYSTEMS = {"darwin": "darwin", "linux": "linux", "windows": "win"}
+_NODE_DIST_ARCHS = {"x86_64": "x64", "arm64": "arm64"}
+
+
+def _build_node_ids(
+    system: str, machine: str, node_version: str
+) -> tuple[str, str, str]:
+    """
+    Build the Node.js download identifiers for a platform.
+
+    Args:
+        system: Normalized system name (darwin, linux, windows)
+        machine: Normalized machine architecture (x86_64, arm64)
+        node_version: The Node.js version to use
+
+    Returns:
+        Tuple of (download URL, archive file name, top-level archive directory)
+    """
+    tarball_dir = (
+        f"node-v{node_version}-{_NODE_DIST_SYSTEMS[system]}-{_NODE_DIST_ARCHS[machine]}"
+    )
+    archive_name = f"{tarball_dir}.{'zip' if system == 'windows' else 'tar.gz'}"
+    url = f"https://nodejs.org/dist/v{node_version}/{archive_name}"
+    return url, archive_name, tarball_dir
 
 
+# Platforms with official Node.js builds we support (system -> machines)
+_NODE_PLATFORMS = {
+    "darwin": ("x86_64", "arm64"),
+    "linux": ("x86_64", "arm64"),
+    "windows": ("x86_64",),
+}
+
+
+@functools.cache
 def get_node_urls(node_version: str = NODE_VERSION) -> dict:
     """
     Get Node.js download URLs for all platforms.
@@ -36,22 +103,20 @@ def get_node_urls(node_version: str = NODE_VERSION) -> dict:
         Dictionary mapping system -> machine -> URL
     """
     return {
-        "darwin": {
-            "x86_64": f"https://nodejs.org/dist/v{node_version}/node-v{node_version}-darwin-x64.tar.gz",
-            "arm64": f"https://nodejs.org/dist/v{node_version}/node-v{node_version}-darwin-arm64.tar.gz",
-        },
-        "linux": {
-            "x86_64": f"https://nodejs.org/dist/v{node_version}/node-v{node_version}-linux-x64.tar.gz",
-            "arm64": f"https://nodejs.org/dist/v{node_version}/node-v{node_version}-linux-arm64.tar.gz",
-        },
-        "windows": {
-            "x86_64": f"https://nodejs.org/dist/v{node_version}/node-v{node_version}-win-x64.zip",
-        },
+        system: {
+            machine: _build_node_ids(system, machine, node_version)[0]
+            for machine in machines
+        }
+        for system, machines in _NODE_PLATFORMS.items()
     }
 
 
-# Pre-computed URLs for the default version
-NODE_URLS = get_node_urls()
+def __getattr__(name: str):
+    """Build the all-platforms NODE_URLS table only when it is asked for."""
+    if name == "NODE_URLS":
+        return get_node_urls()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Known checksums for Node.js binaries - for verification
 # These must be updated when NODE_VERSION changes
@@ -69,6 +134,15 @@ NODE_CHECKSUMS = {
     },
 }
 
+# Download identifiers for the current platform (None if unsupported)
+if MACHINE in _NODE_PLATFORMS.get(SYSTEM, ()):
+    NODE_URL, ARCHIVE_NAME, NODE_TARBALL_DIR = _build_node_ids(
+        SYSTEM, MACHINE, NODE_VERSION
+    )
+else:
+    NODE_URL = ARCHIVE_NAME = NODE_TARBALL_DIR = None
+NODE_CHECKSUM = NODE_CHECKSUMS.get(SYSTEM, {}).get(MACHINE)
+
 # Cache directory for storing downloaded files
 CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "aws-cdk-cli")
 
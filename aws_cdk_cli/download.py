@@ -2,9 +2,17 @@
 Simple file download functionality.
 """
 
+import hashlib
+import http.client
 import os
+import queue
+import threading
+import time
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+__all__ = ["DownloadError", "download_file", "download_file_segmented"]
 
 
 class DownloadError(Exception):
@@ -13,41 +21,310 @@ class DownloadError(Exception):
     pass
 
 
-def download_file(url: str, file_path: str) -> str:
+# Chunk size used to stream responses to disk
+COPY_BUFSIZE = 1 << 20
+
+# Chunks read ahead of the disk writer, bounding memory to this many chunks
+READ_AHEAD_CHUNKS = 4
+
+# Seconds a connect or a single socket read may block before it is abandoned
+DOWNLOAD_TIMEOUT_SECONDS = 30
+
+# Delay before the first retry of an interrupted download, doubled per retry
+RETRY_BACKOFF_SECONDS = 1.0
+
+# Errors raised while a response is streamed that are worth resuming after
+_RESUMABLE_ERRORS = (
+    urllib.error.URLError,
+    http.client.IncompleteRead,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+def download_file(
+    url: str,
+    file_path: str,
+    expected_sha256: str | None = None,
+    retries: int = 0,
+    resume: bool = False,
+) -> str:
     """
     Download a file from a URL.
 
     Args:
         url: URL to download from
         file_path: Path to save the file to
+        expected_sha256: Optional SHA256 hex digest to verify the download
+            against; it is computed while streaming, without re-reading the file
+        retries: Number of times to retry after a network failure. Retries
+            resume from the bytes already written using an HTTP Range request
+        resume: Continue an existing partial file_path instead of overwriting
+            it, and keep the partial file if the download is interrupted. A
+            partial file that turns out to be complete is kept as is, and one
+            larger than the remote file is downloaded again
 
     Returns:
         The path to the downloaded file
 
     Raises:
-        DownloadError: If download fails due to network issues
+        DownloadError: If download fails due to network issues or the
+            checksum does not match
         OSError: If file cannot be written
     """
+    sha256 = hashlib.sha256() if expected_sha256 is not None else None
+    received = 0
+    attempt = 0
     try:
-        with urllib.request.urlopen(url) as response:
-            with open(file_path, "wb") as f:
-                f.write(response.read())
-    except urllib.error.URLError as e:
-        # Network-related errors (DNS, connection refused, timeout, etc.)
-        _cleanup_partial_download(file_path)
-        raise DownloadError(f"Failed to download {url}: {e}") from e
+        if resume and os.path.exists(file_path):
+            # Pick up where an earlier run stopped, hashing what it wrote
+            with open(file_path, "rb") as f:
+                while chunk := f.read(COPY_BUFSIZE):
+                    received += len(chunk)
+                    if sha256 is not None:
+                        sha256.update(chunk)
+        while True:
+            # Ask for the raw bytes so the length and checksum match the archive
+            headers = {"Accept-Encoding": "identity"}
+            if received:
+                headers["Range"] = f"bytes={received}-"
+            request = urllib.request.Request(url, headers=headers)
+            try:
+                with urllib.request.urlopen(
+                    request, timeout=DOWNLOAD_TIMEOUT_SECONDS
+                ) as response:
+                    if received and response.status != 206:
+                        # The server ignored the range, start over
+                        received = 0
+                        if sha256 is not None:
+                            sha256 = hashlib.sha256()
+                    with open(file_path, "ab" if received else "wb") as f:
+                        _copy_response(response, f, sha256)
+                break
+            except urllib.error.HTTPError as e:
+                if e.code != 416 or not received:
+                    raise
+                # Range Not Satisfiable reports the full size as "bytes */<total>"
+                content_range = e.headers.get("Content-Range", "") if e.headers else ""
+                if content_range.rpartition("/")[2] == str(received):
+                    # An earlier run wrote the whole file but stopped before
+                    # publishing it
+                    break
+                # The partial file does not fit the remote one, start over
+                received = 0
+                if sha256 is not None:
+                    sha256 = hashlib.sha256()
+            except _RESUMABLE_ERRORS:
+                if attempt >= retries:
+                    raise
+                delay = RETRY_BACKOFF_SECONDS * 2**attempt
+                attempt += 1
+                try:
+                    received = os.path.getsize(file_path)
+                except OSError:
+                    received = 0
+                    if sha256 is not None:
+                        sha256 = hashlib.sha256()
+                time.sleep(delay)
     except urllib.error.HTTPError as e:
         # HTTP errors (404, 500, etc.)
         _cleanup_partial_download(file_path)
         raise DownloadError(f"HTTP error downloading {url}: {e.code} {e.reason}") from e
+    except _RESUMABLE_ERRORS as e:
+        # Network-related errors (DNS, connection refused, timeout, etc.)
+        if not resume:
+            _cleanup_partial_download(file_path)
+        raise DownloadError(f"Failed to download {url}: {e}") from e
     except OSError:
         # File system errors (permission denied, disk full, etc.)
         _cleanup_partial_download(file_path)
         raise  # Re-raise OSError as-is for caller to handle
 
+    if sha256 is not None and (digest := sha256.hexdigest()) != expected_sha256:
+        _cleanup_partial_download(file_path)
+        raise DownloadError(
+            f"Checksum mismatch for {url}: expected {expected_sha256}, got {digest}"
+        )
+
+    return file_path
+
+
+def download_file_segmented(
+    url: str,
+    file_path: str,
+    connections: int = 4,
+    expected_sha256: str | None = None,
+) -> str:
+    """
+    Download a file over several parallel HTTP Range requests.
+
+    Falls back to a single-stream download_file() when the server does not
+    support ranges, the file is too small to split, or os.pwrite is missing.
+
+    Args:
+        url: URL to download from
+        file_path: Path to save the file to
+        connections: Number of ranges fetched concurrently
+        expected_sha256: Optional SHA256 hex digest to verify the download
+            against; segments arrive out of order, so it is computed after
+            the download completes
+
+    Returns:
+        The path to the downloaded file
+
+    Raises:
+        DownloadError: If download fails due to network issues or the
+            checksum does not match
+        OSError: If file cannot be written
+    """
+    try:
+        total = _probe_length(url) if hasattr(os, "pwrite") else None
+    except urllib.error.HTTPError as e:
+        raise DownloadError(f"HTTP error downloading {url}: {e.code} {e.reason}") from e
+    except _RESUMABLE_ERRORS as e:
+        raise DownloadError(f"Failed to download {url}: {e}") from e
+
+    if connections < 2 or total is None or total < connections * COPY_BUFSIZE:
+        return download_file(url, file_path, expected_sha256=expected_sha256)
+
+    step = -(-total // connections)
+    ranges = [(start, min(start + step, total) - 1) for start in range(0, total, step)]
+    try:
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, total)
+            with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                for future in [
+                    pool.submit(_fetch_range, url, fd, start, end)
+                    for start, end in ranges
+                ]:
+                    future.result()
+        finally:
+            os.close(fd)
+    except urllib.error.HTTPError as e:
+        _cleanup_partial_download(file_path)
+        raise DownloadError(f"HTTP error downloading {url}: {e.code} {e.reason}") from e
+    except _RESUMABLE_ERRORS as e:
+        _cleanup_partial_download(file_path)
+        raise DownloadError(f"Failed to download {url}: {e}") from e
+    except (DownloadError, OSError):
+        _cleanup_partial_download(file_path)
+        raise
+
+    if expected_sha256 is not None:
+        with open(file_path, "rb") as f:
+            sha256 = hashlib.sha256()
+            while chunk := f.read(COPY_BUFSIZE):
+                sha256.update(chunk)
+        if (digest := sha256.hexdigest()) != expected_sha256:
+            _cleanup_partial_download(file_path)
+            raise DownloadError(
+                f"Checksum mismatch for {url}: expected {expected_sha256}, got {digest}"
+            )
+
     return file_path
 
 
+def _probe_length(url: str) -> int | None:
+    """Return the size of url if the server honors Range requests, else None."""
+    request = urllib.request.Request(
+        url, headers={"Range": "bytes=0-0", "Accept-Encoding": "identity"}
+    )
+    with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT_SECONDS) as response:
+        if response.status != 206:
+            return None
+        # Content-Range: bytes 0-0/<total>
+        total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+def _fetch_range(url: str, fd: int, start: int, end: int) -> None:
+    """Fetch bytes start..end (inclusive) of url and write them at that offset."""
+    request = urllib.request.Request(
+        url, headers={"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+    )
+    with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT_SECONDS) as response:
+        if response.status != 206:
+            raise DownloadError(f"Server ignored range request for {url}")
+        offset = start
+        while chunk := response.read(COPY_BUFSIZE):
+            view = memoryview(chunk)
+            while view:
+                written = os.pwrite(fd, view, offset)
+                view = view[written:]
+                offset += written
+    if offset != end + 1:
+        raise DownloadError(
+            f"Incomplete range {start}-{end} from {url}: got {offset - start} bytes"
+        )
+
+
+def _copy_response(source, dest, sha256=None) -> None:
+    """
+    Copy source to dest in chunks, feeding each chunk to sha256 if given.
+
+    A background thread reads ahead from source into a bounded queue, so
+    network reads overlap with disk writes and hashing on the calling thread.
+    However the reader stops, it queues a final None, so the writer never
+    waits on a reader that is gone.
+
+    Args:
+        source: Readable binary stream, usually an HTTP response
+        dest: Writable binary file
+        sha256: Optional hashlib object updated with every chunk written
+
+    Raises:
+        OSError, http.client.HTTPException: If reading source or writing dest
+            fails; http.client.IncompleteRead if the reader stopped early
+    """
+    chunks = queue.Queue(maxsize=READ_AHEAD_CHUNKS)
+    stop = threading.Event()
+
+    def put(item) -> None:
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def produce() -> None:
+        read = source.read
+        try:
+            while not stop.is_set():
+                chunk = read(COPY_BUFSIZE)
+                put(chunk)
+                if not chunk:
+                    return
+        except (OSError, http.client.HTTPException) as e:
+            put(e)
+        finally:
+            put(None)
+
+    reader = threading.Thread(target=produce, daemon=True)
+    reader.start()
+    write = dest.write
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                # The reader died without reaching the end of the response
+                raise http.client.IncompleteRead(b"")
+            if isinstance(chunk, Exception):
+                raise chunk
+            if not chunk:
+                break
+            write(chunk)
+            if sha256 is not None:
+                sha256.update(chunk)
+    finally:
+        # Wait for the reader even when writing failed, so the caller never
+        # closes source while a read is still in progress; once stop is set
+        # it returns after its current read
+        stop.set()
+        reader.join()
+
+
 def _cleanup_partial_download(file_path: str) -> None:
     """Remove a partially downloaded file if it exists."""
     try:
@@ -4,10 +4,11 @@ Module for installing AWS CDK npm package and Node.js runtime.
 
 import os
 import sys
+import stat
 import subprocess
 import logging
+import functools
 import shutil
-import tempfile
 import zipfile
 import tarfile
 import json
@@ -15,15 +16,20 @@ import hashlib
 import re
 import urllib.request
 import urllib.error
+from contextlib import closing, contextmanager
 
 # Import our custom modules instead of external dependencies
 from . import semver_helper as semver
 from . import download
+from .runtime import get_system_node_path, iter_candidate_node_paths
 from .constants import (
     NODE_VERSION,
     MIN_BUN_VERSION,
-    NODE_URLS,
-    NODE_CHECKSUMS,
+    MIN_NODE_VERSION,
+    NODE_URL,
+    NODE_CHECKSUM,
+    ARCHIVE_NAME,
+    NODE_TARBALL_DIR,
     CACHE_DIR,
     SYSTEM,
     MACHINE,
@@ -33,10 +39,34 @@ from aws_cdk_cli import (
     NODE_MODULES_DIR,
     NODE_PLATFORM_DIR,
     NODE_BIN_PATH,
+    _json_loads,
+    get_node_version,
     is_cdk_installed,
     is_node_installed,
+    invalidate_runtime_state,
 )
 
+# Use ISA-L's SIMD inflate for the Node.js tarball when the optional "fast"
+# extra is installed; the stdlib gzip module is the drop-in fallback
+try:
+    from isal import igzip as _gzip
+except ImportError:
+    import gzip as _gzip
+
+# rapidgzip decodes a single gzip stream on several threads; it is picked up
+# when installed separately and takes precedence over the decoders above
+try:
+    import rapidgzip as _rapidgzip
+except ImportError:
+    _rapidgzip = None
+
+# Advisory locks let one process own the resumable partial download; where
+# they are missing (Windows) every process downloads to a private file
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,69 +82,61 @@ def check_npm_available() -> bool:
     Returns:
         True if npm is available and executable, False otherwise.
     """
-    try:
-        subprocess.run(
-            ["npm", "--version"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            check=True,
-        )
-        return True
-    except (subprocess.SubprocessError, FileNotFoundError):
-        return False
+    return shutil.which("npm") is not None
 
 
 def get_latest_cdk_version() -> str | None:
     """Get the latest AWS CDK version from npm registry.
 
+    The registry is queried directly over HTTPS first; npm (system or via the
+    bundled Node.js) is only spawned when the registry cannot be reached.
+
     Returns:
         The version string of the latest CDK, or None if unavailable.
     """
     try:
-        # First try to get it from npm
-        version = subprocess.check_output(
+        with urllib.request.urlopen(
+            "https://registry.npmjs.org/aws-cdk/latest", timeout=5
+        ) as response:
+            return _json_loads(response.read())["version"]
+    except (urllib.error.URLError, OSError, ValueError, KeyError) as e:
+        logger.debug("Could not query npm registry directly: %s", e)
+
+    try:
+        # Fall back to npm, which may be configured with a proxy or mirror
+        return subprocess.check_output(
             ["npm", "view", "aws-cdk", "version"], text=True
         ).strip()
-        return version
     except (subprocess.SubprocessError, FileNotFoundError):
-        try:
-            # Fallback to using the downloaded Node.js if available
-            if is_node_installed():
-                version = subprocess.check_output(
-                    [
-                        NODE_BIN_PATH,
-                        "-e",
-                        "console.log(require('child_process').execSync('npm view aws-cdk version').toString().trim())",
-                    ],
-                    text=True,
-                ).strip()
-                return version
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pass
+        pass
 
-        # Last resort: try to fetch from npm registry using urllib
-        try:
-            with urllib.request.urlopen(
-                "https://registry.npmjs.org/aws-cdk/latest"
-            ) as response:
-                data = json.loads(response.read().decode("utf-8"))
-                return data.get("version")
-        except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError, OSError):
-            pass
+    try:
+        # Last resort: run npm through the downloaded Node.js if available
+        if is_node_installed():
+            return subprocess.check_output(
+                [
+                    NODE_BIN_PATH,
+                    "-e",
+                    "console.log(require('child_process').execSync('npm view aws-cdk version').toString().trim())",
+                ],
+                text=True,
+            ).strip()
+    except (subprocess.SubprocessError, FileNotFoundError):
+        pass
 
     logger.error("Failed to get latest AWS CDK version from npm")
     return None
 
 
-def verify_node_binary(file_path: str, expected_checksum: str | None) -> bool:
-    """Verify the downloaded Node.js binary against expected checksum.
+def _checksum_to_verify(expected_checksum: str | None) -> str | None:
+    """Return the checksum to verify against, or None if verification is skipped.
 
     Args:
-        file_path: Path to the downloaded file.
         expected_checksum: Expected SHA256 checksum hex string.
 
     Returns:
-        True if checksum matches or verification is skipped, False otherwise.
+        The expected checksum, or None when it is missing or verification is
+        disabled in a CI environment.
     """
     # Skip verification in CI environment if configured
     if (
@@ -122,327 +144,477 @@ def verify_node_binary(file_path: str, expected_checksum: str | None) -> bool:
         and os.environ.get("SKIP_CHECKSUM_VERIFICATION") == "true"
     ):
         logger.warning("Skipping checksum verification in CI environment")
-        return True
+        return None
 
     if not expected_checksum:
         logger.warning("No checksum provided for verification, skipping")
+        return None
+
+    return expected_checksum
+
+
+def _download_connections() -> int:
+    """Return the number of parallel connections to download Node.js with.
+
+    Set by AWS_CDK_CLI_DOWNLOAD_CONNECTIONS; defaults to a single stream.
+    """
+    try:
+        return int(os.environ.get("AWS_CDK_CLI_DOWNLOAD_CONNECTIONS", "1"))
+    except ValueError:
+        logger.warning("Ignoring invalid AWS_CDK_CLI_DOWNLOAD_CONNECTIONS value")
+        return 1
+
+
+def _sha256_file(f) -> str:
+    """Return the SHA256 hex digest of a binary file, read in chunks."""
+    if hasattr(hashlib, "file_digest"):  # Python 3.11+
+        return hashlib.file_digest(f, "sha256").hexdigest()
+    sha256 = hashlib.sha256()
+    while chunk := f.read(1 << 20):
+        sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def verify_node_binary(file_path: str, expected_checksum: str | None) -> bool:
+    """Verify the downloaded Node.js binary against expected checksum.
+
+    Args:
+        file_path: Path to the downloaded file.
+        expected_checksum: Expected SHA256 checksum hex string.
+
+    Returns:
+        True if checksum matches or verification is skipped, False otherwise.
+    """
+    expected_checksum = _checksum_to_verify(expected_checksum)
+    if expected_checksum is None:
         return True
 
     try:
         with open(file_path, "rb") as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
+            file_hash = _sha256_file(f)
 
         if file_hash == expected_checksum:
             logger.info("Checksum verification passed")
             return True
         else:
             logger.error(
-                f"Checksum verification failed. Expected: {expected_checksum}, Got: {file_hash}"
+                "Checksum verification failed. Expected: %s, Got: %s",
+                expected_checksum,
+                file_hash,
             )
             return False
     except OSError as e:
-        logger.error(f"Error reading file for checksum: {e}")
+        logger.error("Error reading file for checksum: %s", e)
         return False
 
 
-def download_node() -> tuple[bool, str]:
-    """Download Node.js binaries for the current platform.
+# Buffer size for copying archive members to disk (tarfile default is 16 KiB)
+TAR_COPY_BUFSIZE = 1 << 20
+
+# Network failures tolerated while downloading Node.js before giving up
+NODE_DOWNLOAD_RETRIES = 3
+
+# Use the 'data' extraction filter when available (3.12+, and backported to
+# 3.10.12/3.11.4); it also skips restoring file ownership
+_TAR_EXTRACT_KWARGS = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+# Leading bytes of the archive formats Node.js is published in
+_ARCHIVE_MAGIC = {".zip": b"PK\x03\x04", ".tar.gz": b"\x1f\x8b"}
+
+# Minimum free space for keeping the Node.js archive on a tmpfs mount
+MIN_TMPFS_FREE_BYTES = 100 * 1024 * 1024
+
+# Octal escapes used for whitespace in /proc/self/mountinfo fields
+_OCTAL_ESCAPE_RE = re.compile(r"\\([0-7]{3})")
+
+
+@contextmanager
+def _open_tarball(path: str):
+    """Open a .tar.gz for reading, using the fastest gzip decoder available.
+
+    Args:
+        path: Path to the gzip-compressed tarball.
+
+    Yields:
+        An open tarfile.TarFile.
+    """
+    if _rapidgzip is not None:
+        fileobj = _rapidgzip.open(path, parallelization=os.cpu_count() or 1)
+    else:
+        fileobj = _gzip.open(path, "rb")
+    with (
+        closing(fileobj),
+        tarfile.open(fileobj=fileobj, mode="r:", copybufsize=TAR_COPY_BUFSIZE) as tar,
+    ):
+        yield tar
+
+
+def _file_identity(path: str) -> str:
+    """Return the inode and ctime of path, which change when it is replaced."""
+    st = os.stat(path)
+    return f"{st.st_ino} {st.st_ctime_ns}"
+
+
+def _publish_staged_tree(staging_dir: str, target_dir: str) -> None:
+    """Move each top-level entry of staging_dir into target_dir, then remove it.
+
+    Entries are moved with a single rename each, so target_dir only ever holds
+    complete copies. An existing directory of the same name is first renamed
+    into staging_dir and deleted along with it.
+
+    Args:
+        staging_dir: Directory the archive was extracted into.
+        target_dir: Directory on the same filesystem to publish the entries in.
+    """
+    with os.scandir(staging_dir) as entries:
+        names = [entry.name for entry in entries]
+    for name in names:
+        target = os.path.join(target_dir, name)
+        if os.path.isdir(target) and not os.path.islink(target):
+            os.replace(target, os.path.join(staging_dir, f".old-{name}"))
+        os.replace(os.path.join(staging_dir, name), target)
+    shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def _tmpfs_mount_points() -> set[str]:
+    """Return the tmpfs mount points of the current process (Linux only).
 
     Returns:
-        A tuple of (success, result) where success is True if download succeeded
-        and result is the path to the node binary, or an error message on failure.
+        Set of mount point paths, empty if /proc/self/mountinfo is unavailable.
     """
+    mount_points = set()
     try:
-        # We're now standardized on arm64 so no need for special handling
-        node_url = NODE_URLS[SYSTEM][MACHINE]
-    except KeyError:
-        error_msg = f"Unsupported platform: {SYSTEM}-{MACHINE}"
-        logger.error(error_msg)
-        return False, error_msg
+        with open("/proc/self/mountinfo") as f:
+            for line in f:
+                fields = line.split()
+                # Optional fields end with "-", followed by the filesystem type
+                try:
+                    separator = fields.index("-")
+                except ValueError:
+                    continue
+                if fields[separator + 1] == "tmpfs":
+                    # Whitespace in mount points is octal-escaped (e.g. \040)
+                    mount_points.add(
+                        _OCTAL_ESCAPE_RE.sub(
+                            lambda m: chr(int(m.group(1), 8)), fields[4]
+                        )
+                    )
+    except OSError:
+        pass
+    return mount_points
 
-    # Get expected checksum for verification
-    expected_checksum = NODE_CHECKSUMS.get(SYSTEM, {}).get(MACHINE)
 
-    logger.info(f"Downloading Node.js v{NODE_VERSION} for {SYSTEM}-{MACHINE}...")
+@functools.cache
+def get_archive_cache_dir() -> str:
+    """Get the directory used to cache the downloaded Node.js archive.
 
-    # Create node_binaries directory if it doesn't exist
-    os.makedirs(NODE_PLATFORM_DIR, exist_ok=True)
+    On Linux a memory-backed tmpfs (``$XDG_RUNTIME_DIR`` or ``/dev/shm``) with
+    enough free space is preferred over CACHE_DIR, which may sit on a slow or
+    encrypted home mount. An archive kept on tmpfs is removed once extracted,
+    so it only holds memory for the duration of an install.
+
+    Returns:
+        Path to the archive cache directory.
+    """
+    if SYSTEM == "linux":
+        tmpfs_mounts = _tmpfs_mount_points()
+        for candidate in (os.environ.get("XDG_RUNTIME_DIR"), "/dev/shm"):
+            if not candidate or os.path.realpath(candidate) not in tmpfs_mounts:
+                continue
+            try:
+                usage = os.statvfs(candidate)
+                if usage.f_bavail * usage.f_frsize < MIN_TMPFS_FREE_BYTES:
+                    continue
+
+                # The mount may be shared between users, so only trust a
+                # directory that we own and nobody else can write to
+                archive_dir = os.path.join(candidate, f"aws-cdk-cli-{os.getuid()}")
+                os.makedirs(archive_dir, mode=0o700, exist_ok=True)
+                st = os.lstat(archive_dir)
+                if (
+                    stat.S_ISDIR(st.st_mode)
+                    and st.st_uid == os.getuid()
+                    and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+                ):
+                    return archive_dir
+            except OSError as e:
+                logger.debug("Cannot cache Node.js archive in %s: %s", candidate, e)
 
     # Create cache directory if it doesn't exist
     os.makedirs(CACHE_DIR, exist_ok=True)
+    return CACHE_DIR
 
-    # Determine the archive filename (zip for Windows, tar.gz for others)
-    archive_ext = "zip" if SYSTEM == "windows" else "tar.gz"
 
-    # Node.js uses x64 instead of x86_64 in filenames
-    filename_arch = "x64" if MACHINE == "x86_64" and SYSTEM != "windows" else MACHINE
+@contextmanager
+def _owned_part_file(cached_archive: str):
+    """Claim the stable partial download next to cached_archive.
 
-    archive_name = f"node-v{NODE_VERSION}-{SYSTEM}-{filename_arch}.{archive_ext}"
+    The stable name is only handed out while holding an exclusive lock, so
+    concurrent installers never append to the same file. Other processes get
+    a private partial file that is not resumed.
 
-    cached_archive = os.path.join(CACHE_DIR, archive_name)
+    Args:
+        cached_archive: Path the archive is cached at.
 
-    def download_fresh_copy():
-        """Download a fresh copy and cache it."""
-        logger.debug("Downloading a fresh copy of Node.js")
-        temp_file = tempfile.NamedTemporaryFile(delete=False).name
+    Yields:
+        A tuple of (part_file, owned) where owned is True for the stable,
+        resumable partial file.
+    """
+    fd = None
+    if fcntl is not None:
         try:
-            # Download copy
-            download.download_file(url=node_url, file_path=temp_file)
+            fd = os.open(f"{cached_archive}.lock", os.O_WRONLY | os.O_CREAT, 0o644)
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            if fd is not None:
+                os.close(fd)
+                fd = None
+    try:
+        if fd is None:
+            yield f"{cached_archive}.{os.getpid()}.part", False
+        else:
+            yield f"{cached_archive}.part", True
+    finally:
+        # Closing the descriptor releases the lock
+        if fd is not None:
+            os.close(fd)
+
 
-            # Verify checksum before caching
-            if expected_checksum and not verify_node_binary(
-                temp_file, expected_checksum
-            ):
-                raise ValueError("Downloaded file failed checksum verification")
+def _download_fresh_copy(cached_archive: str) -> str:
+    """Download a fresh copy of the Node.js archive and cache it.
 
-            # Verify the download
-            if not is_valid_archive(temp_file):
+    Args:
+        cached_archive: Path to cache the archive at.
+
+    Returns:
+        The path of the cached archive.
+    """
+    logger.debug("Downloading a fresh copy of Node.js")
+    with _owned_part_file(cached_archive) as (part_file, owned):
+        try:
+            # Download copy, verifying the checksum while it streams to disk
+            expected_checksum = _checksum_to_verify(NODE_CHECKSUM)
+            connections = _download_connections()
+            if connections > 1:
+                download.download_file_segmented(
+                    url=NODE_URL,
+                    file_path=part_file,
+                    connections=connections,
+                    expected_sha256=expected_checksum,
+                )
+            else:
+                # A stable partial file lets an interrupted download resume
+                # next run; without a checksum a spliced file could not be
+                # told apart from the published archive, so start over
+                download.download_file(
+                    url=NODE_URL,
+                    file_path=part_file,
+                    expected_sha256=expected_checksum,
+                    retries=NODE_DOWNLOAD_RETRIES,
+                    resume=owned and expected_checksum is not None,
+                )
+            if expected_checksum:
+                # A matching checksum already proves this is the published archive
+                logger.info("Checksum verification passed")
+            elif not _is_valid_archive(part_file):
+                # Without a checksum, at least make sure this looks like an archive
+                os.unlink(part_file)
                 raise ValueError("Downloaded file is not a valid archive")
 
-            # Cache the downloaded file
-            os.makedirs(os.path.dirname(cached_archive), exist_ok=True)
-            shutil.copy2(temp_file, cached_archive)
-            logger.debug(f"Cached Node.js archive at {cached_archive}")
+            # The partial file sits next to the cache entry, so publishing it
+            # is an atomic rename rather than a copy
+            os.replace(part_file, cached_archive)
+            logger.debug("Cached Node.js archive at %s", cached_archive)
             return cached_archive
         except (download.DownloadError, ValueError, OSError) as e:
-            logger.error(f"Error downloading Node.js: {e}")
-            # Clean up temp file on error (TOCTOU-safe: try to delete, ignore if missing)
-            try:
-                os.unlink(temp_file)
-            except FileNotFoundError:
-                pass
+            # download_file removes the partial file unless it can be resumed
+            logger.error("Error downloading Node.js: %s", e)
             raise
-        finally:
-            # Clean up the temporary file (TOCTOU-safe: try to delete, ignore if missing)
+
+
+def _is_valid_archive(file_path: str) -> bool:
+    """Check if the file starts like an archive of the type its name implies.
+
+    Only the header is read; listing the archive would decompress all of it
+    just before extraction does the same. A damaged body is caught when the
+    archive is extracted.
+    """
+    # Downloads are checked under their partial-file name
+    name = file_path.removesuffix(".part")
+    for suffix, magic in _ARCHIVE_MAGIC.items():
+        if name.endswith(suffix):
             try:
-                os.unlink(temp_file)
-            except FileNotFoundError:
-                pass
+                with open(file_path, "rb") as f:
+                    return f.read(len(magic)) == magic
+            except OSError:
+                return False
+    return False
+
+
+def _safe_extract(tar, path=".", members=None, *, numeric_owner=False):
+    """Extract a tarball, checking each member stays inside path.
 
-    def is_valid_archive(file_path):
-        """Check if the file is a valid archive."""
+    Members are checked and extracted in a single pass over the archive, so a
+    compressed tarball is only decompressed once. The directory holding each
+    file is created with one os.makedirs the first time it is seen, so tarfile
+    finds it in place. A rejected member stops the extraction part-way; callers
+    extract into a staging directory they discard on failure.
+
+    Raises:
+        PathTraversalError: If a member, or the target of a link member, would
+            be outside path.
+    """
+    # Resolve the destination once and check members with string operations;
+    # resolving every member path on disk costs a stat per path component
+    root = os.path.realpath(path)
+    prefix = os.path.join(root, "")
+
+    # Directories already created, including the parents makedirs filled in
+    created_dirs = {root}
+    for member in tar if members is None else members:
+        member_path = os.path.normpath(os.path.join(root, member.name))
+        if member_path != root and not member_path.startswith(prefix):
+            raise PathTraversalError(
+                f"Attempted path traversal in tar file: {member.name}"
+            )
+        # Links must not lead outside either, or a later member could be
+        # written through them; hard link targets are relative to the root
+        if member.issym() or member.islnk():
+            base = os.path.dirname(member_path) if member.issym() else root
+            link_path = os.path.normpath(os.path.join(base, member.linkname))
+            if link_path != root and not link_path.startswith(prefix):
+                raise PathTraversalError(
+                    f"Attempted path traversal in tar file: "
+                    f"{member.name} -> {member.linkname}"
+                )
+        if member.isfile():
+            directory = os.path.dirname(member_path)
+            if directory not in created_dirs:
+                os.makedirs(directory, exist_ok=True)
+                while directory not in created_dirs:
+                    created_dirs.add(directory)
+                    directory = os.path.dirname(directory)
+        tar.extract(member, path, numeric_owner=numeric_owner, **_TAR_EXTRACT_KWARGS)
+
+
+def download_node() -> tuple[bool, str]:
+    """Download Node.js binaries for the current platform.
+
+    Returns:
+        A tuple of (success, result) where success is True if download succeeded
+        and result is the path to the node binary, or an error message on failure.
+    """
+    if NODE_URL is None:
+        error_msg = f"Unsupported platform: {SYSTEM}-{MACHINE}"
+        logger.error(error_msg)
+        return False, error_msg
+
+    # The marker sits beside the install it describes and records the
+    # installed binary's inode and ctime, which a re-extraction or a removed
+    # install cannot reproduce (tar restores the archived mtime)
+    install_marker = os.path.join(NODE_PLATFORM_DIR, ".install-ok")
+
+    # Skip all archive work when this exact release is already extracted
+    if NODE_CHECKSUM:
         try:
-            if file_path.endswith(".zip"):
-                with zipfile.ZipFile(file_path, "r") as zip_ref:
-                    # Just check if it's a valid zip by listing files
-                    zip_ref.namelist()
-            else:  # .tar.gz
-                with tarfile.open(file_path, "r:gz") as tar_ref:
-                    # Just check if it's a valid tarball by listing files
-                    tar_ref.getnames()
-            return True
-        except (zipfile.BadZipFile, tarfile.TarError, OSError):
-            return False
+            with open(install_marker) as f:
+                checksum, identity, marked_path = f.read().splitlines()
+            if checksum == NODE_CHECKSUM and identity == _file_identity(marked_path):
+                logger.debug("Node.js v%s already installed", NODE_VERSION)
+                return True, marked_path
+        except (OSError, ValueError):
+            pass
+
+    logger.info("Downloading Node.js v%s for %s-%s...", NODE_VERSION, SYSTEM, MACHINE)
+
+    # Create node_binaries directory if it doesn't exist
+    os.makedirs(NODE_PLATFORM_DIR, exist_ok=True)
+
+    archive_dir = get_archive_cache_dir()
+    cached_archive = os.path.join(archive_dir, ARCHIVE_NAME)
 
     # Try to download a fresh copy if needed
     if os.path.exists(cached_archive):
-        logger.debug(f"Using cached Node.js archive: {cached_archive}")
+        logger.debug("Using cached Node.js archive: %s", cached_archive)
         download_path = cached_archive
     else:
         try:
-            download_path = download_fresh_copy()
+            download_path = _download_fresh_copy(cached_archive)
         except (download.DownloadError, ValueError, OSError) as e:
             return False, f"Failed to download Node.js: {e}"
 
+    # Extract into a private staging directory inside NODE_PLATFORM_DIR and move
+    # the result into place, so an interrupted run never leaves a partial tree
+    extract_dir = os.path.join(NODE_PLATFORM_DIR, f".staging-{os.getpid()}")
+
     # Extract the archive
     try:
-        # Extract to NODE_PLATFORM_DIR so the tarball's folder goes inside darwin/arm64/
-        extract_dir = NODE_PLATFORM_DIR
-        os.makedirs(extract_dir, exist_ok=True)
+        # The tree is about to change, so the marker no longer describes it
+        if os.path.exists(install_marker):
+            os.unlink(install_marker)
+        shutil.rmtree(extract_dir, ignore_errors=True)
+        os.makedirs(extract_dir)
 
-        logger.debug(f"Extracting Node.js archive to {extract_dir}")
+        logger.debug("Extracting Node.js archive to %s", extract_dir)
         if cached_archive.endswith(".zip"):
             with zipfile.ZipFile(download_path, "r") as zip_ref:
                 zip_ref.extractall(extract_dir)
         else:
-            with tarfile.open(download_path, "r:*") as tar_ref:
-
-                def is_within_directory(directory: str, target: str) -> bool:
-                    """Check if target path is within directory (path traversal protection).
+            with _open_tarball(download_path) as tar_ref:
+                _safe_extract(tar_ref, extract_dir)
 
-                    Uses pathlib for correct path-level comparison. The previous
-                    implementation using os.path.commonprefix was vulnerable because
-                    commonprefix operates on strings, not paths. For example:
-                    - directory: /home/user/archive
-                    - target: /home/user/archive-evil/file.txt
-                    - commonprefix would return /home/user/archive (WRONG - appears safe)
+        _publish_staged_tree(extract_dir, NODE_PLATFORM_DIR)
+        logger.info("Node.js binaries extracted to %s", NODE_PLATFORM_DIR)
 
-                    This implementation uses Path.relative_to() which correctly
-                    determines path containment.
-                    """
-                    from pathlib import Path
-
-                    try:
-                        abs_directory = Path(directory).resolve()
-                        abs_target = Path(target).resolve()
-                        # relative_to raises ValueError if target is not relative to directory
-                        abs_target.relative_to(abs_directory)
-                        return True
-                    except (ValueError, OSError):
-                        return False
-
-                def safe_extract(tar, path=".", members=None, *, numeric_owner=False):
-                    for member in tar.getmembers():
-                        member_path = os.path.join(path, member.name)
-                        if not is_within_directory(path, member_path):
-                            raise PathTraversalError(
-                                f"Attempted path traversal in tar file: {member.name}"
-                            )
-
-                    # Use the 'data' filter parameter if available (Python 3.12+)
-                    if sys.version_info >= (3, 12):
-                        tar.extractall(
-                            path, members, numeric_owner=numeric_owner, filter="data"
-                        )
-                    else:
-                        tar.extractall(path, members, numeric_owner=numeric_owner)
-
-                safe_extract(tar_ref, extract_dir)
-
-        logger.info(f"Node.js binaries extracted to {NODE_PLATFORM_DIR}")
-
-        # If we used a temporary file (not a cached one), delete it
-        # TOCTOU-safe: try to delete directly, handle exceptions
-        if download_path != cached_archive:
+        # An archive on tmpfs pins memory and is not read again once the
+        # install marker is written, so drop it now that it is extracted
+        if archive_dir != CACHE_DIR:
             try:
-                os.unlink(download_path)
-            except FileNotFoundError:
-                pass  # Already deleted, ignore
+                os.unlink(cached_archive)
             except OSError as e:
-                logger.warning(f"Could not delete temporary file {download_path}: {e}")
-
-        # Verify the binary exists - use a more direct approach
-        # Expected path patterns based on Node.js distribution layout
-        expected_bin_paths = []
-
-        # The parent that contains the NODE_PLATFORM_DIR (e.g. .../node_binaries)
-        parent_dir = os.path.dirname(NODE_PLATFORM_DIR)
+                logger.debug("Could not remove %s: %s", cached_archive, e)
 
+        # Verify the binary exists where the archive we just extracted puts it;
+        # other node-v* layouts are picked up by the scan below
         if SYSTEM == "windows":
-            # Windows paths
-            expected_bin_paths = [
-                # Standard path in NODE_BIN_PATH
-                NODE_BIN_PATH,
-                # Direct in platform dir
-                os.path.join(NODE_PLATFORM_DIR, "node.exe"),
-                # Version-specific subdirectory
-                os.path.join(
-                    NODE_PLATFORM_DIR, f"node-v{NODE_VERSION}-win-x64", "node.exe"
-                ),
-            ]
-        else:
-            # For architecture in filenames, Node.js distributions always use:
-            # - x64 (not x86_64)
-            # - arm64 (not aarch64)
-            arch_suffix = "x64" if MACHINE == "x86_64" else "arm64"
-
-            # Unix paths (Linux/macOS)
-            expected_bin_paths = [
-                # Standard path in NODE_BIN_PATH
-                NODE_BIN_PATH,
-                # Direct in platform dir
-                os.path.join(NODE_PLATFORM_DIR, "bin", "node"),
-                # Version-specific subdirectory - typical Node.js layout
-                os.path.join(
-                    NODE_PLATFORM_DIR,
-                    f"node-v{NODE_VERSION}-{SYSTEM}-{arch_suffix}",
-                    "bin",
-                    "node",
-                ),
-            ]
-
-            # Add cross-platform paths to handle different directory structures
-            # regardless of what the platform claims to be
-            expected_bin_paths.extend(
-                [
-                    # Linux paths with both architectures
-                    os.path.join(
-                        NODE_PLATFORM_DIR,
-                        f"node-v{NODE_VERSION}-linux-x64",
-                        "bin",
-                        "node",
-                    ),
-                    os.path.join(
-                        NODE_PLATFORM_DIR,
-                        f"node-v{NODE_VERSION}-linux-arm64",
-                        "bin",
-                        "node",
-                    ),
-                    # macOS paths with both architectures
-                    os.path.join(
-                        NODE_PLATFORM_DIR,
-                        f"node-v{NODE_VERSION}-darwin-x64",
-                        "bin",
-                        "node",
-                    ),
-                    os.path.join(
-                        NODE_PLATFORM_DIR,
-                        f"node-v{NODE_VERSION}-darwin-arm64",
-                        "bin",
-                        "node",
-                    ),
-                ]
+            tarball_bin_path = os.path.join(
+                NODE_PLATFORM_DIR, NODE_TARBALL_DIR, "node.exe"
             )
-
-            # Special case: if we're on linux/aarch64, also check the extracted directory that uses arm64 in the name
-            if SYSTEM == "linux" and MACHINE == "aarch64":
-                expected_bin_paths.append(
-                    os.path.join(
-                        parent_dir,
-                        "linux",
-                        "arm64",
-                        f"node-v{NODE_VERSION}-linux-arm64",
-                        "bin",
-                        "node",
-                    )
-                )
-
-            # Special case: check for a location where the tarball might have been extracted
-            # with a different parent directory structure
-            node_version_dir = f"node-v{NODE_VERSION}-{SYSTEM}-{arch_suffix}"
-            expected_bin_paths.extend(
-                [
-                    os.path.join(
-                        parent_dir, node_version_dir, "bin", "node"
-                    ),  # Extracted to parent dir
-                    os.path.join(
-                        NODE_PLATFORM_DIR, "node", "bin", "node"
-                    ),  # Extracted to 'node' subdir
-                ]
+        else:
+            tarball_bin_path = os.path.join(
+                NODE_PLATFORM_DIR, NODE_TARBALL_DIR, "bin", "node"
             )
+        expected_bin_paths = [NODE_BIN_PATH, tarball_bin_path]
 
-        logger.debug(f"Checking for Node.js binary in: {expected_bin_paths}")
+        logger.debug("Checking for Node.js binary in: %s", expected_bin_paths)
 
         # Check all possible paths and use the first one that exists
         node_path = None
         for path in expected_bin_paths:
-            if os.path.exists(path) and os.path.isfile(path):
-                logger.info(f"Found Node.js binary at {path}")
+            if os.path.isfile(path):
+                logger.info("Found Node.js binary at %s", path)
                 # Make sure the binary is executable on Unix-like systems
                 # TOCTOU-safe: try chmod directly, handle exceptions
                 if SYSTEM != "windows":
                     try:
                         os.chmod(path, 0o755)
-                        logger.debug(f"Made Node.js binary executable: {path}")
+                        logger.debug("Made Node.js binary executable: %s", path)
                     except OSError as e:
-                        logger.debug(f"Could not chmod binary (may already be executable): {e}")
+                        logger.debug(
+                            "Could not chmod binary (may already be executable): %s", e
+                        )
                 node_path = path
                 break
 
-        # If none found, perform a more exhaustive search
+        # If none found, look in any node-v* directory the archive unpacked
         if not node_path:
             logger.debug(
-                "Binary not found in expected locations, searching recursively..."
+                "Binary not found in expected locations, scanning node-v* directories..."
             )
-            node_exe = "node.exe" if SYSTEM == "windows" else "node"
-
-            # Search recursively in NODE_PLATFORM_DIR
-            for root, dirs, files in os.walk(NODE_PLATFORM_DIR):
-                if node_exe in files:
-                    node_path = os.path.join(root, node_exe)
-                    logger.info(
-                        f"Found Node.js binary during recursive search: {node_path}"
-                    )
+            for path in iter_candidate_node_paths(NODE_PLATFORM_DIR):
+                if os.path.isfile(path):
+                    node_path = path
+                    logger.info("Found Node.js binary at %s", node_path)
                     # Make sure it's executable on Unix
                     # TOCTOU-safe: try chmod directly, handle exceptions
                     if SYSTEM != "windows":
@@ -453,25 +625,49 @@ def download_node() -> tuple[bool, str]:
                     break
 
         # Final check if we found a valid binary
-        if not node_path or not os.path.exists(node_path):
+        if not node_path:
             error_msg = (
                 "Node.js binary not found after extraction in any expected location"
             )
             logger.error(error_msg)
             # Log the directory structure for debugging
-            logger.debug(f"Contents of {NODE_PLATFORM_DIR}:")
-            if os.path.exists(NODE_PLATFORM_DIR):
+            if logger.isEnabledFor(logging.DEBUG) and os.path.exists(NODE_PLATFORM_DIR):
+                logger.debug("Contents of %s:", NODE_PLATFORM_DIR)
                 for root, dirs, files in os.walk(NODE_PLATFORM_DIR):
-                    logger.debug(f"Directory: {root}")
+                    logger.debug("Directory: %s", root)
                     for d in dirs:
-                        logger.debug(f"  Subdir: {d}")
+                        logger.debug("  Subdir: %s", d)
                     for f in files:
-                        logger.debug(f"  File: {f}")
+                        logger.debug("  File: %s", f)
             return False, error_msg
 
+        invalidate_runtime_state()
+
+        # Record the verified release so later runs can skip re-extraction
+        if NODE_CHECKSUM:
+            try:
+                identity = _file_identity(node_path)
+                with open(install_marker, "w") as f:
+                    f.write(f"{NODE_CHECKSUM}\n{identity}\n{node_path}\n")
+            except OSError as e:
+                logger.debug("Could not write install marker %s: %s", install_marker, e)
+
         # Return the actual path to the Node.js binary
         return True, node_path
-    except (zipfile.BadZipFile, tarfile.TarError, OSError, PathTraversalError) as e:
+    except (
+        zipfile.BadZipFile,
+        tarfile.TarError,
+        OSError,
+        EOFError,
+        PathTraversalError,
+    ) as e:
+        shutil.rmtree(extract_dir, ignore_errors=True)
+        if isinstance(e, (zipfile.BadZipFile, tarfile.TarError, EOFError)):
+            # Drop an unreadable archive so the next run downloads it again
+            try:
+                os.unlink(cached_archive)
+            except OSError:
+                pass
         error_msg = f"Failed to extract Node.js binaries: {e}"
         logger.error(error_msg)
         return False, error_msg
@@ -481,33 +677,42 @@ def find_system_nodejs() -> str | None:
     """
     Find the Node.js executable on the system PATH and return its path.
 
-    This function wraps the shared implementation in runtime.py for consistency.
+    This function wraps the shared implementation in runtime.py for consistency;
+    shutil.which already only returns executable files.
 
     Returns:
         Path to the Node.js executable, or None if not found.
     """
-    from . import runtime
-
-    try:
-        node_path = runtime.get_system_node_path()
-        if node_path and os.path.exists(node_path) and os.access(node_path, os.X_OK):
-            return node_path
-    except OSError as e:
-        logger.debug(f"Error finding system Node.js: {e}")
-
-    return None
+    return get_system_node_path()
 
 
 def get_nodejs_version(node_path):
     """
     Get the version of Node.js from the given executable path.
 
+    The result is cached until the executable's modification time changes.
+
     Args:
         node_path (str): Path to the Node.js executable
 
     Returns:
         str: Version string (without v prefix), or None if failed
     """
+    # The downloaded Node.js version is known without starting it
+    if node_path == NODE_BIN_PATH and (version := get_node_version()):
+        return version
+
+    try:
+        mtime_ns = os.stat(node_path).st_mtime_ns
+    except OSError as e:
+        logger.debug("Error getting Node.js version: %s", e)
+        return None
+    return _probe_nodejs_version(node_path, mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _probe_nodejs_version(node_path, mtime_ns):
+    """Run `node --version`; mtime_ns only keys the cache."""
     try:
         result = subprocess.run(
             [node_path, "--version"], capture_output=True, text=True
@@ -515,11 +720,10 @@ def get_nodejs_version(node_path):
         if result.returncode == 0:
             version = result.stdout.strip()
             # Remove the 'v' prefix if present
-            if version.startswith("v"):
-                version = version[1:]
+            version = version.removeprefix("v")
             return version
     except (subprocess.SubprocessError, OSError) as e:
-        logger.debug(f"Error getting Node.js version: {e}")
+        logger.debug("Error getting Node.js version: %s", e)
 
     return None
 
@@ -528,18 +732,27 @@ def get_cdk_node_requirements():
     """
     Extract the Node.js version requirements from CDK's package.json.
 
+    The parsed result is cached per package.json modification time, so the file
+    is only read again after CDK is reinstalled.
+
     Returns:
         str: Node.js version requirement string (e.g. ">= 22.0.0"), or None if not found
     """
-    MIN_NODE_VERSION = "22.0.0"
+    package_json_path = os.path.join(NODE_MODULES_DIR, "aws-cdk", "package.json")
     try:
-        package_json_path = os.path.join(NODE_MODULES_DIR, "aws-cdk", "package.json")
-        if not os.path.exists(package_json_path):
-            logger.debug("AWS CDK package.json not found")
-            return f">= {MIN_NODE_VERSION}"
+        mtime_ns = os.stat(package_json_path).st_mtime_ns
+    except OSError:
+        logger.debug("AWS CDK package.json not found")
+        return f">= {MIN_NODE_VERSION}"
+    return _read_node_requirement(package_json_path, mtime_ns)
 
-        with open(package_json_path, "r") as f:
-            package_data = json.load(f)
+
+@functools.lru_cache(maxsize=1)
+def _read_node_requirement(package_json_path: str, mtime_ns: int) -> str:
+    """Read the engines.node requirement; mtime_ns only keys the cache."""
+    try:
+        with open(package_json_path, "rb") as f:
+            package_data = _json_loads(f.read())
 
         # Extract Node.js version requirements from the engines field
         node_requirement = package_data.get("engines", {}).get("node")
@@ -552,7 +765,7 @@ def get_cdk_node_requirements():
                     return f">= {MIN_NODE_VERSION}"
             return node_requirement
     except (OSError, json.JSONDecodeError, ValueError) as e:
-        logger.debug(f"Error reading CDK Node.js requirements: {e}")
+        logger.debug("Error reading CDK Node.js requirements: %s", e)
 
     # Default fallback requirement if we can't determine
     return f">= {MIN_NODE_VERSION}"  # Updated minimum for Node.js LTS
@@ -565,13 +778,15 @@ def get_supported_nodejs_versions():
     Returns:
         str: The minimum supported Node.js version
     """
-    # First try to get requirements from package.json
-    node_req = get_cdk_node_requirements()
+    return _min_supported_version(get_cdk_node_requirements())
+
 
+@functools.lru_cache(maxsize=8)
+def _min_supported_version(node_req: str | None) -> str:
+    """Return the lowest minimum version allowed by a requirement string."""
+    min_version = None
     if node_req:
         # Extract minimum from requirement string
-        min_version = None
-
         try:
             # Handle multiple requirements separated by ||
             if "||" in node_req:
@@ -593,7 +808,7 @@ def get_supported_nodejs_versions():
                 # Single requirement
                 min_version = extract_min_from_req(node_req)
         except ValueError as e:
-            logger.debug(f"Error parsing Node.js requirement '{node_req}': {e}")
+            logger.debug("Error parsing Node.js requirement '%s': %s", node_req, e)
 
     # Conservative default based on current CDK support
     if not min_version:
@@ -602,6 +817,30 @@ def get_supported_nodejs_versions():
     return min_version
 
 
+# Exact "x.y.z" version requirement
+_EXACT_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+$")
+
+# Comparison operators recognised in engines requirements, two-character
+# operators first so ">=" is not mistaken for ">"
+_REQ_OPERATORS = (">=", "<=", ">", "<", "^", "~")
+
+
+def _split_operator(req):
+    """
+    Split a leading comparison operator off a requirement string.
+
+    Args:
+        req (str): Stripped requirement string (e.g. ">= 14.15.0")
+
+    Returns:
+        tuple: (operator, version) where operator is None if there is none
+    """
+    for op in _REQ_OPERATORS:
+        if req.startswith(op):
+            return op, req[len(op) :].strip()
+    return None, req
+
+
 def extract_min_from_req(req):
     """
     Extract minimum version from a requirement string.
@@ -613,32 +852,29 @@ def extract_min_from_req(req):
         str: extracted minimum version or None if couldn't extract
     """
     req = req.strip()
-    min_version = None
+    op, version = _split_operator(req)
 
-    # Handle >= or >
-    if req.startswith(">="):
-        min_version = req.replace(">=", "").strip()
-    elif req.startswith(">"):
+    # Handle >=, ^ and ~
+    if op == ">=" or op == "^" or op == "~":
+        return version
+    if op == ">":
         # Increment the last digit to make it inclusive
-        base_version = req.replace(">", "").strip()
-        version_parts = base_version.split(".")
+        version_parts = version.split(".")
         version_parts[-1] = str(int(version_parts[-1]) + 1)
-        min_version = ".".join(version_parts)
-
-    # Handle ^
-    elif req.startswith("^"):
-        min_version = req.replace("^", "").strip()
+        return ".".join(version_parts)
+    if op is not None:
+        # Upper bounds carry no minimum
+        return None
 
     # Handle range with hyphen (x.y.z - a.b.c)
-    elif " - " in req:
-        parts = req.split(" - ")
-        min_version = parts[0].strip()
+    if " - " in req:
+        return req.split(" - ")[0].strip()
 
     # Handle exact version
-    elif re.match(r"^\d+\.\d+\.\d+$", req):
-        min_version = req
+    if _EXACT_VERSION_RE.match(req):
+        return req
 
-    return min_version
+    return None
 
 
 def is_nodejs_compatible(version, requirement_str):
@@ -672,22 +908,16 @@ def is_nodejs_compatible(version, requirement_str):
             return semver.compare(version, min_version) >= 0
 
         # Basic pattern matching for common version requirement formats
-        if req.startswith(">="):
-            min_version = req.replace(">=", "").strip()
-            return semver.compare(version, min_version) >= 0
-        elif req.startswith(">"):
-            min_version = req.replace(">", "").strip()
-            return semver.compare(version, min_version) > 0
-        elif req.startswith("<="):
-            max_version = req.replace("<=", "").strip()
-            return semver.compare(version, max_version) <= 0
-        elif req.startswith("<"):
-            max_version = req.replace("<", "").strip()
-            return semver.compare(version, max_version) < 0
-        elif req.startswith("^"):
-            # Caret range - compatible with same major version and >= base version
-            base_version = req.replace("^", "").strip()
-            return semver.compare(version, base_version) >= 0
+        op, bound = _split_operator(req)
+        if op == ">=" or op == "^" or op == "~":
+            # Caret or tilde range - same major version and >= base version
+            return semver.compare(version, bound) >= 0
+        elif op == ">":
+            return semver.compare(version, bound) > 0
+        elif op == "<=":
+            return semver.compare(version, bound) <= 0
+        elif op == "<":
+            return semver.compare(version, bound) < 0
         elif " - " in req:
             # Range with hyphen
             parts = req.split(" - ")
@@ -697,18 +927,18 @@ def is_nodejs_compatible(version, requirement_str):
                 semver.compare(version, min_version) >= 0
                 and semver.compare(version, max_version) <= 0
             )
-        elif re.match(r"^\d+\.\d+\.\d+$", req):
+        elif _EXACT_VERSION_RE.match(req):
             # Exact version match
             return semver.compare(version, req) == 0
 
         # If we can't parse the requirement, be conservative
         logger.warning(
-            f"Could not parse Node.js version requirement: {requirement_str}"
+            "Could not parse Node.js version requirement: %s", requirement_str
         )
         return False
 
     except (ValueError, TypeError, AttributeError) as e:
-        logger.debug(f"Error checking Node.js compatibility: {e}")
+        logger.debug("Error checking Node.js compatibility: %s", e)
         return False
 
 
@@ -744,10 +974,10 @@ def setup_nodejs() -> tuple[bool, str]:
         logger.info("Using downloaded Node.js")
         success, node_path = download_node()
         if success:
-            logger.debug(f"Successfully downloaded Node.js to {node_path}")
+            logger.debug("Successfully downloaded Node.js to %s", node_path)
             return True, node_path
         else:
-            logger.error(f"Failed to download Node.js: {node_path}")
+            logger.error("Failed to download Node.js: %s", node_path)
             return False, node_path
 
     # Try Bun only if explicitly requested
@@ -757,23 +987,27 @@ def setup_nodejs() -> tuple[bool, str]:
         if bun_path:
             try:
                 bun_version = get_bun_version(bun_path)
-                reported_version = get_bun_reported_nodejs_version(bun_path)
-                is_compatible = is_bun_compatible_with_cdk(bun_path, node_req)
+                is_compatible, reported_version = is_bun_compatible_with_cdk(
+                    bun_path, node_req
+                )
 
                 if is_compatible:
-                    logger.debug(f"Using Bun v{bun_version} at {bun_path}")
+                    logger.debug("Using Bun v%s at %s", bun_version, bun_path)
                     logger.debug(
-                        f"Bun reports as Node.js v{reported_version}, compatible with AWS CDK requirements: {node_req}"
+                        "Bun reports as Node.js v%s, compatible with AWS CDK requirements: %s",
+                        reported_version,
+                        node_req,
                     )
                     return True, bun_path
                 else:
                     logger.debug(
-                        f"Bun v{bun_version} reports as Node.js v{reported_version}, which is not compatible with AWS CDK requirements: {node_req}"
+                        "Bun v%s reports as Node.js v%s, which is not compatible with AWS CDK requirements: %s",
+                        bun_version,
+                        reported_version,
+                        node_req,
                     )
             except (subprocess.SubprocessError, OSError, ValueError) as e:
-                logger.debug(
-                    f"Error checking Bun compatibility: {e}"
-                )
+                logger.debug("Error checking Bun compatibility: %s", e)
         else:
             logger.debug("Bun not found on the system")
         logger.debug("Could not use Bun as runtime, falling back to system Node.js")
@@ -790,12 +1024,14 @@ def setup_nodejs() -> tuple[bool, str]:
             if is_compatible or force_system_node:
                 if is_compatible:
                     logger.debug(
-                        f"Using system Node.js v{node_version} at {system_node}"
+                        "Using system Node.js v%s at %s", node_version, system_node
                     )
-                    logger.debug(f"Compatible with AWS CDK requirements: {node_req}")
+                    logger.debug("Compatible with AWS CDK requirements: %s", node_req)
                 else:
                     logger.warning(
-                        f"System Node.js v{node_version} may not be compatible with AWS CDK requirements: {node_req}"
+                        "System Node.js v%s may not be compatible with AWS CDK requirements: %s",
+                        node_version,
+                        node_req,
                     )
                     logger.warning(
                         "Using anyway because AWS_CDK_CLI_USE_SYSTEM_NODE is set"
@@ -803,7 +1039,9 @@ def setup_nodejs() -> tuple[bool, str]:
                 return True, system_node
             else:
                 logger.debug(
-                    f"System Node.js v{node_version} is not compatible with AWS CDK requirements: {node_req}"
+                    "System Node.js v%s is not compatible with AWS CDK requirements: %s",
+                    node_version,
+                    node_req,
                 )
     else:
         if force_system_node:
@@ -814,17 +1052,17 @@ def setup_nodejs() -> tuple[bool, str]:
 
     # Finally, check if we already have a downloaded Node.js
     if is_node_installed():
-        logger.debug(f"Using downloaded Node.js at {NODE_BIN_PATH}")
+        logger.debug("Using downloaded Node.js at %s", NODE_BIN_PATH)
         return True, NODE_BIN_PATH
 
     # If no suitable runtime found yet, download Node.js
     logger.info("No suitable JavaScript runtime found. Downloading Node.js...")
     success, node_path = download_node()
     if success:
-        logger.debug(f"Successfully downloaded Node.js to {node_path}")
+        logger.debug("Successfully downloaded Node.js to %s", node_path)
         return True, node_path
     else:
-        logger.error(f"Failed to download Node.js: {node_path}")
+        logger.error("Failed to download Node.js: %s", node_path)
         return False, node_path
 
 
@@ -835,20 +1073,46 @@ def find_system_bun():
     Returns:
         str: Path to the Bun executable, or None if not found
     """
-    try:
-        bun_path = shutil.which("bun")
-        if bun_path and os.path.exists(bun_path) and os.access(bun_path, os.X_OK):
-            return bun_path
-    except OSError as e:
-        logger.debug(f"Error finding system Bun: {e}")
+    # shutil.which checks os.X_OK itself, so no further stat is needed
+    return shutil.which("bun")
 
-    return None
+
+# First x.y.z in `bun --version` output
+_BUN_VERSION_RE = re.compile(r"(\d+\.\d+\.\d+)")
+
+# Seconds to wait for a Bun version probe before giving up on that binary
+BUN_PROBE_TIMEOUT = 5
+
+# Prints Bun's version, then the Node.js version it reports, one per line
+_BUN_VERSIONS_SCRIPT = "console.log(Bun.version);console.log(process.version)"
+
+
+def _extract_bun_version(output):
+    """
+    Extract the x.y.z version from Bun's version output.
+
+    Args:
+        output (str): Version output (e.g. "1.2.3" or "v1.2.3-canary.1")
+
+    Returns:
+        str: The x.y.z version, or None if there is none
+    """
+    version = output.strip().removeprefix("v")
+    # Bun prints a bare x.y.z; only search with the regex for anything else
+    base = version.partition("-")[0].partition("+")[0]
+    parts = base.split(".")
+    if len(parts) == 3 and all(part.isdigit() for part in parts):
+        return base
+    match = _BUN_VERSION_RE.search(version)
+    return match.group(1) if match else None
 
 
 def get_bun_version(bun_path):
     """
     Get the version of Bun from the given executable path.
 
+    The result is cached until the executable's modification time changes.
+
     Args:
         bun_path (str): Path to the Bun executable
 
@@ -856,19 +1120,34 @@ def get_bun_version(bun_path):
         str: Version string (without v prefix), or None if failed
     """
     try:
-        result = subprocess.run([bun_path, "--version"], capture_output=True, text=True)
+        mtime_ns = os.stat(bun_path).st_mtime_ns
+    except OSError as e:
+        logger.debug("Error getting Bun version: %s", e)
+        return None
+    # Bun releases with --eval support answer both version probes in one run
+    version = _probe_bun_versions(bun_path, mtime_ns)[0]
+    return version or _probe_bun_version(bun_path, mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _probe_bun_version(bun_path, mtime_ns):
+    """Run `bun --version`; mtime_ns only keys the cache."""
+    try:
+        result = subprocess.run(
+            [bun_path, "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=BUN_PROBE_TIMEOUT,
+        )
         if result.returncode == 0:
-            version = result.stdout.strip()
-            # Remove the 'v' prefix if present
-            if version.startswith("v"):
-                version = version[1:]
-            # Handle potential extra output by extracting just the version
-            match = re.search(r"(\d+\.\d+\.\d+)", version)
-            if match:
-                return match.group(1)
-            return version
+            output = result.stdout
+            # _extract_bun_version strips the 'v' prefix itself
+            return _extract_bun_version(output) or output.strip().removeprefix("v")
+    except subprocess.TimeoutExpired:
+        logger.warning("Bun version probe timed out after %ss", BUN_PROBE_TIMEOUT)
     except (subprocess.SubprocessError, OSError) as e:
-        logger.debug(f"Error getting Bun version: {e}")
+        logger.debug("Error getting Bun version: %s", e)
 
     return None
 
@@ -877,6 +1156,8 @@ def get_bun_reported_nodejs_version(bun_path):
     """
     Get the Node.js version that Bun reports itself as.
 
+    The result is cached until the executable's modification time changes.
+
     Args:
         bun_path (str): Path to the Bun executable
 
@@ -884,22 +1165,70 @@ def get_bun_reported_nodejs_version(bun_path):
         str: Node.js version string, or None if failed
     """
     try:
-        # Use --eval flag to get process.version
+        mtime_ns = os.stat(bun_path).st_mtime_ns
+    except OSError as e:
+        logger.debug("Error getting Bun's reported Node.js version: %s", e)
+        return None
+    return _probe_bun_versions(bun_path, mtime_ns)[1]
+
+
+@functools.lru_cache(maxsize=8)
+def _probe_bun_versions(bun_path, mtime_ns):
+    """
+    Print Bun's own version and the Node.js version it reports in one run.
+
+    mtime_ns only keys the cache.
+
+    Args:
+        bun_path (str): Path to the Bun executable
+        mtime_ns (int): Modification time of the executable
+
+    Returns:
+        tuple: (bun_version, nodejs_version), either of which may be None
+    """
+    try:
         result = subprocess.run(
-            [bun_path, "--eval", "console.log(process.version)"],
-            capture_output=True,
+            [bun_path, "--eval", _BUN_VERSIONS_SCRIPT],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
+            timeout=BUN_PROBE_TIMEOUT,
         )
         if result.returncode == 0:
-            version = result.stdout.strip()
-            # Remove the 'v' prefix if present
-            if version.startswith("v"):
-                version = version[1:]
-            return version
+            lines = result.stdout.splitlines()
+            bun_version = _extract_bun_version(lines[0]) if lines else None
+            nodejs_version = (
+                lines[1].strip().removeprefix("v") if len(lines) > 1 else ""
+            )
+            return bun_version, (nodejs_version or None)
+    except subprocess.TimeoutExpired:
+        logger.warning("Bun version probe timed out after %ss", BUN_PROBE_TIMEOUT)
     except (subprocess.SubprocessError, OSError) as e:
-        logger.debug(f"Error getting Bun's reported Node.js version: {e}")
+        logger.debug("Error getting Bun versions: %s", e)
 
-    return None
+    return None, None
+
+
+def _version_at_least(version, minimum):
+    """
+    Check whether version >= minimum.
+
+    Plain x.y.z versions are compared as integer tuples; anything else (e.g.
+    prereleases) goes through semver.compare.
+
+    Args:
+        version (str): Version to check (e.g. "1.2.3")
+        minimum (str): Minimum version (e.g. "1.1.0")
+
+    Returns:
+        bool: True if version is at least minimum
+    """
+    try:
+        return tuple(map(int, version.split("."))) >= tuple(
+            map(int, minimum.split("."))
+        )
+    except ValueError:
+        return semver.compare(version, minimum) >= 0
 
 
 def is_bun_compatible_with_cdk(bun_path, node_req):
@@ -915,9 +1244,11 @@ def is_bun_compatible_with_cdk(bun_path, node_req):
     """
     # First check if Bun version is at least 1.1.0 (needed for --eval support)
     bun_version = get_bun_version(bun_path)
-    if not bun_version or semver.compare(bun_version, MIN_BUN_VERSION) < 0:
+    if not bun_version or not _version_at_least(bun_version, MIN_BUN_VERSION):
         logger.info(
-            f"Bun version {bun_version} is less than minimum required {MIN_BUN_VERSION}"
+            "Bun version %s is less than minimum required %s",
+            bun_version,
+            MIN_BUN_VERSION,
         )
         return False, None
 
@@ -932,8 +1263,9 @@ def is_bun_compatible_with_cdk(bun_path, node_req):
     return is_compatible, reported_version
 
 
-def main():
-    """Main function for installer script."""
+@functools.cache
+def _get_parser():
+    """Build the installer's argument parser once per process."""
     import argparse
 
     parser = argparse.ArgumentParser(description="AWS CDK Installer")
@@ -946,8 +1278,14 @@ def main():
         help="Check if Node.js and AWS CDK are installed",
     )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
+    return parser
+
+
+def main():
+    """Main function for installer script."""
+    args = _get_parser().parse_args()
 
-    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
     # Enable verbose logging if requested
     if args.verbose:
@@ -956,38 +1294,54 @@ def main():
         urllib_logger = logging.getLogger("urllib3")
         urllib_logger.setLevel(logging.DEBUG)
 
-    # Default behavior: if no arguments are provided, download Node.js only
-    if not any([args.download_node, args.check]):
-        logger.info("No arguments provided, downloading Node.js...")
+    # Run the first requested action; without one, download Node.js only
+    for name, action in _ACTIONS.items():
+        if getattr(args, name):
+            return action()
+    return _download_node_by_default()
+
+
+def _download_node_by_default():
+    """Download Node.js when no action is given; returns the exit code."""
+    logger.info("No arguments provided, downloading Node.js...")
 
-        success, error = download_node()
-        if not success:
-            logger.error(f"Failed to download Node.js: {error}")
-            return 1
+    success, error = download_node()
+    if not success:
+        logger.error("Failed to download Node.js: %s", error)
+        return 1
+
+    logger.info("Node.js installed successfully")
+    return 0
 
-        logger.info("Node.js installed successfully")
-        return 0
 
-    # Execute the requested actions
-    if args.check:
-        node_installed = is_node_installed()
-        cdk_installed = is_cdk_installed()
+def _check_installed():
+    """Report whether Node.js and AWS CDK are installed; returns the exit code."""
+    node_installed = is_node_installed()
+    cdk_installed = is_cdk_installed()
 
-        logger.info(f"Node.js is {'installed' if node_installed else 'not installed'}")
-        logger.info(f"AWS CDK is {'installed' if cdk_installed else 'not installed'}")
+    logger.info("Node.js is %s", "installed" if node_installed else "not installed")
+    logger.info("AWS CDK is %s", "installed" if cdk_installed else "not installed")
 
-        return 0 if node_installed and cdk_installed else 1
+    return 0 if node_installed and cdk_installed else 1
 
-    if args.download_node:
-        success, error = download_node()
-        if not success:
-            logger.error(f"Failed to download Node.js: {error}")
-            return 1
 
-        logger.info("Node.js downloaded successfully")
+def _download_node_action():
+    """Download Node.js binaries; returns the exit code."""
+    success, error = download_node()
+    if not success:
+        logger.error("Failed to download Node.js: %s", error)
+        return 1
 
+    logger.info("Node.js downloaded successfully")
     return 0
 
 
+# Command-line actions by argparse destination, in order of precedence
+_ACTIONS = {
+    "check": _check_installed,
+    "download_node": _download_node_action,
+}
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -11,15 +11,21 @@ import logging
 import tempfile
 import zipfile
 import tarfile
-import hashlib
 from pathlib import Path
 
+# Use ISA-L's SIMD inflate when the optional "fast" extra is installed; the
+# stdlib gzip module is the drop-in fallback
+try:
+    from isal import igzip as _gzip
+except ImportError:
+    import gzip as _gzip
+
 # Handle imports for both module and standalone script execution
 try:
-    from .constants import NODE_VERSION, NODE_URLS, NODE_CHECKSUMS, SYSTEM, MACHINE
+    from .constants import NODE_VERSION, NODE_URL, NODE_CHECKSUM, SYSTEM, MACHINE
     from . import download
 except ImportError:
-    from constants import NODE_VERSION, NODE_URLS, NODE_CHECKSUMS, SYSTEM, MACHINE
+    from constants import NODE_VERSION, NODE_URL, NODE_CHECKSUM, SYSTEM, MACHINE
     import download
 
 
@@ -142,40 +148,12 @@ def is_node_installed():
     return os.path.exists(node_path)
 
 
-def verify_checksum(file_path: str, expected_checksum: str) -> bool:
-    """Verify the downloaded file against expected SHA256 checksum."""
-    if not expected_checksum:
-        logger.warning("No checksum provided for verification, skipping")
-        return True
-
-    try:
-        with open(file_path, "rb") as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
-
-        if file_hash == expected_checksum:
-            logger.debug("Checksum verification passed")
-            return True
-        else:
-            logger.error(
-                f"Checksum verification failed. Expected: {expected_checksum}, Got: {file_hash}"
-            )
-            return False
-    except OSError as e:
-        logger.error(f"Error reading file for checksum: {e}")
-        return False
-
-
 def download_node():
     """Download Node.js binaries for the current platform."""
-    try:
-        node_url = NODE_URLS[SYSTEM][MACHINE]
-    except KeyError:
+    if NODE_URL is None:
         logger.error(f"Unsupported platform: {SYSTEM}-{MACHINE}")
         return False
 
-    # Get expected checksum for verification
-    expected_checksum = NODE_CHECKSUMS.get(SYSTEM, {}).get(MACHINE)
-
     logger.info(f"Downloading Node.js v{NODE_VERSION} for {SYSTEM}-{MACHINE}...")
 
     # Create node_binaries directory if it doesn't exist
@@ -185,17 +163,16 @@ def download_node():
     # Download the Node.js binaries with progress bar
     temp_file = tempfile.NamedTemporaryFile(delete=False)
     try:
-        # Download with progress bar
-        download.download_file(url=node_url, file_path=temp_file.name)
-
-        # Close the file before verifying/extracting (important for Windows)
+        # Download with progress bar, verifying the checksum as it streams to disk
+        if not NODE_CHECKSUM:
+            logger.warning("No checksum provided for verification, skipping")
+        download.download_file(
+            url=NODE_URL, file_path=temp_file.name, expected_sha256=NODE_CHECKSUM
+        )
+
+        # Close the file before extracting (important for Windows)
         temp_file.close()
 
-        # Verify checksum before extraction
-        if expected_checksum and not verify_checksum(temp_file.name, expected_checksum):
-            logger.error("Downloaded file failed checksum verification")
-            return False
-
         # Path traversal protection helper
         def is_within_directory(directory: str, target: str) -> bool:
             """Check if target path is within directory (path traversal protection).
@@ -213,7 +190,7 @@ def download_node():
                 return False
 
         # Extract the Node.js binaries
-        if node_url.endswith(".zip"):
+        if NODE_URL.endswith(".zip"):
             with zipfile.ZipFile(temp_file.name, "r") as zip_ref:
                 # Verify all members are within extract directory
                 for member in zip_ref.namelist():
@@ -228,7 +205,10 @@ def download_node():
                 else:
                     zip_ref.extractall(extract_dir)
         else:  # .tar.gz
-            with tarfile.open(temp_file.name, "r:gz") as tar_ref:
+            with (
+                _gzip.open(temp_file.name, "rb") as gz_file,
+                tarfile.open(fileobj=gz_file, mode="r:") as tar_ref,
+            ):
                 # Verify all members are within extract directory
                 for member in tar_ref.getmembers():
                     member_path = os.path.join(extract_dir, member.name)
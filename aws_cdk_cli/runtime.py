@@ -4,14 +4,10 @@ import os
 import subprocess
 import logging
 import shutil
-from typing import Optional
+from collections.abc import Iterable, Iterator
 
 from .constants import CDK_PACKAGE_NAME, SYSTEM
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger("aws-cdk-runtime")
 
 
@@ -20,15 +16,68 @@ def get_package_dir():
     return os.path.dirname(os.path.abspath(__file__))
 
 
-def find_node_in_directory(platform_dir: str) -> Optional[str]:
+def list_node_version_dirs(platform_dir: str) -> list[str] | None:
     """
-    Search for node binary in a given directory.
+    List the node-v* directories (official distribution layout) in a directory.
 
-    This is the canonical implementation for finding node binaries in a platform
-    directory. It searches in the following order:
+    Args:
+        platform_dir: Directory to scan
+
+    Returns:
+        Names of the node-v* subdirectories, or None if the directory is unreadable
+    """
+    try:
+        with os.scandir(platform_dir) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.name.startswith("node-v") and entry.is_dir()
+            ]
+    except OSError:
+        return None
+
+
+def iter_candidate_node_paths(
+    platform_dir: str, version_dirs: list[str] | None = None
+) -> Iterator[str]:
+    """
+    Yield the locations where a node binary may live in a platform directory.
+
+    Only the known layouts are considered, in priority order:
     1. node-v* directories (official Node.js distribution structure)
     2. Direct path (bin/node or node.exe)
-    3. Recursive search as fallback
+
+    Args:
+        platform_dir: Directory to search for node binary
+        version_dirs: Result of list_node_version_dirs() if already known
+
+    Yields:
+        Candidate paths to the node binary; they are not checked for existence
+    """
+    if version_dirs is None:
+        version_dirs = list_node_version_dirs(platform_dir)
+        if version_dirs is None:
+            return
+
+    for version_dir in version_dirs:
+        if SYSTEM == "windows":
+            yield os.path.join(platform_dir, version_dir, "node.exe")
+        else:
+            yield os.path.join(platform_dir, version_dir, "bin", "node")
+
+    # Direct binary path (for Docker containers or custom installations)
+    if SYSTEM == "windows":
+        yield os.path.join(platform_dir, "node.exe")
+    else:
+        yield os.path.join(platform_dir, "bin", "node")
+
+
+def find_node_in_directory(platform_dir: str) -> str | None:
+    """
+    Search for node binary in a given directory.
+
+    This is the canonical implementation for finding node binaries in a platform
+    directory. The candidates come from iter_candidate_node_paths().
 
     Args:
         platform_dir: Directory to search for node binary
@@ -36,59 +85,27 @@ def find_node_in_directory(platform_dir: str) -> Optional[str]:
     Returns:
         Path to node binary if found, None otherwise
     """
-    if not os.path.exists(platform_dir):
-        return None
+    return first_node_binary(iter_candidate_node_paths(platform_dir))
 
-    node_file = "node.exe" if SYSTEM == "windows" else "node"
-    potential_paths = []
 
-    # Check for node-v* directories FIRST (official Node.js distribution structure)
-    try:
-        for item in os.listdir(platform_dir):
-            if item.startswith("node-v") and os.path.isdir(
-                os.path.join(platform_dir, item)
-            ):
-                bin_path = os.path.join(
-                    platform_dir,
-                    item,
-                    "bin" if SYSTEM != "windows" else "",
-                    node_file,
-                )
-                if os.path.exists(bin_path) and (
-                    SYSTEM == "windows" or os.access(bin_path, os.X_OK)
-                ):
-                    potential_paths.append(bin_path)
-    except (FileNotFoundError, PermissionError):
-        pass
+def first_node_binary(candidates: Iterable[str]) -> str | None:
+    """
+    Return the first candidate that is an existing, executable node binary.
 
-    # Fallback: direct binary path (for Docker containers or custom installations)
-    if SYSTEM == "windows":
-        direct_path = os.path.join(platform_dir, node_file)
-    else:
-        direct_path = os.path.join(platform_dir, "bin", node_file)
-
-    if os.path.exists(direct_path) and (
-        SYSTEM == "windows" or os.access(direct_path, os.X_OK)
-    ):
-        potential_paths.append(direct_path)
-
-    # Return the first valid binary found
-    if potential_paths:
-        return potential_paths[0]
-
-    # Fallback: search recursively
-    for root, dirs, files in os.walk(platform_dir):
-        if node_file in files:
-            full_path = os.path.join(root, node_file)
-            if os.path.exists(full_path) and (
-                SYSTEM == "windows" or os.access(full_path, os.X_OK)
-            ):
-                return full_path
+    Args:
+        candidates: Candidate paths, e.g. from iter_candidate_node_paths()
+
+    Returns:
+        Path to node binary if found, None otherwise
+    """
+    for path in candidates:
+        if os.path.isfile(path) and (SYSTEM == "windows" or os.access(path, os.X_OK)):
+            return path
 
     return None
 
 
-def get_node_path() -> Optional[str]:
+def get_node_path() -> str | None:
     """
     Get the path to the node binary. This function will check for the node binary
     in the following locations:
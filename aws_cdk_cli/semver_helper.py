@@ -14,8 +14,7 @@ VersionTuple = tuple[int, int, int, str, str]
 def parse_version(version_str: str) -> Optional[VersionTuple]:
     """Parse a version string into a tuple of components: (major, minor, patch, prerelease, build)."""
     # Strip leading 'v' if present
-    if version_str.startswith("v"):
-        version_str = version_str[1:]
+    version_str = version_str.removeprefix("v")
 
     # Basic semver regex pattern
     pattern = r"^(\d+)\.(\d+)\.(\d+)(?:-([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?(?:\+([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?$"
@@ -20,7 +20,7 @@ with open(os.path.join("aws_cdk_cli", "constants.py"), "r") as f:
     exec(f.read(), _constants)
 
 NODE_VERSION = _constants["NODE_VERSION"]
-NODE_URLS = _constants["NODE_URLS"]
+NODE_URLS = _constants["get_node_urls"]()
 SYSTEM = _constants["SYSTEM"]
 MACHINE = _constants["MACHINE"]
 
@@ -5,13 +5,17 @@ Pytest test file for Bun runtime detection and compatibility.
 
 import pytest
 import os
+import subprocess
 import sys
+from unittest import mock
 
 # Use our custom semver_helper
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from aws_cdk_cli import semver_helper as semver
 
 from aws_cdk_cli.installer import (
+    _extract_bun_version,
+    _version_at_least,
     find_system_bun,
     get_bun_version,
     get_bun_reported_nodejs_version,
@@ -63,6 +67,69 @@ def test_get_bun_version():
         assert semver.is_valid(version)
 
 
+def test_extract_bun_version():
+    """Test extracting the x.y.z version from Bun's output."""
+    assert _extract_bun_version("1.2.3\n") == "1.2.3"
+    assert _extract_bun_version("v1.2.3-canary.1+abc") == "1.2.3"
+    assert _extract_bun_version("bun 1.2.3 (linux)") == "1.2.3"
+    assert _extract_bun_version("unknown") is None
+
+
+def test_version_at_least():
+    """Test the Bun minimum version check, including non-numeric versions."""
+    assert _version_at_least("1.1.0", "1.1.0")
+    assert _version_at_least("1.10.0", "1.9.9")
+    assert not _version_at_least("1.0.36", "1.1.0")
+    assert _version_at_least("1.2.0-canary.1", "1.1.0")
+    assert not _version_at_least("1.1.0-canary.1", "1.1.0")
+
+
+def test_get_bun_version_cached_until_binary_changes(tmp_path):
+    """Test that Bun is only probed again after its executable changes."""
+    bun_path = tmp_path / "bun"
+    bun_path.write_text("")
+    completed = subprocess.CompletedProcess([], 0, stdout="1.2.3\n", stderr="")
+
+    with mock.patch("subprocess.run", return_value=completed) as mock_run:
+        assert get_bun_version(str(bun_path)) == "1.2.3"
+        assert get_bun_version(str(bun_path)) == "1.2.3"
+        assert mock_run.call_count == 1
+
+        os.utime(bun_path, ns=(1, 1))
+        assert get_bun_version(str(bun_path)) == "1.2.3"
+        assert mock_run.call_count == 2
+
+
+def test_bun_compatibility_probed_with_single_process(tmp_path):
+    """Test that Bun's own and reported Node.js versions come from one run."""
+    bun_path = tmp_path / "bun"
+    bun_path.write_text("")
+    completed = subprocess.CompletedProcess([], 0, stdout="1.2.3\nv22.1.0\n", stderr="")
+
+    with mock.patch("subprocess.run", return_value=completed) as mock_run:
+        assert is_bun_compatible_with_cdk(str(bun_path), ">= 22.0.0") == (
+            True,
+            "22.1.0",
+        )
+        assert get_bun_version(str(bun_path)) == "1.2.3"
+
+    mock_run.assert_called_once()
+    assert mock_run.call_args[0][0][1] == "--eval"
+
+
+def test_bun_probe_timeout(tmp_path):
+    """Test that a hanging Bun binary is given up on after a timeout."""
+    bun_path = tmp_path / "bun"
+    bun_path.write_text("")
+
+    with mock.patch(
+        "subprocess.run", side_effect=subprocess.TimeoutExpired("bun", 5)
+    ) as mock_run:
+        assert get_bun_version(str(bun_path)) is None
+
+    assert all(call.kwargs["timeout"] for call in mock_run.call_args_list)
+
+
 @pytest.mark.integration
 def test_get_bun_reported_nodejs_version():
     """Test getting Node.js version reported by Bun."""
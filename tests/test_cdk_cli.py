@@ -3,6 +3,7 @@ Pytest-based tests for the AWS CDK Python wrapper.
 """
 
 import os
+import stat
 import sys
 import subprocess
 import tempfile
@@ -242,6 +243,22 @@ def test_cdk_run_help():
             mock_run_cdk.assert_called_with(["--help"])
 
 
+def test_main_passes_through_cdk_arguments():
+    """Test that wrapper flags are consumed and CDK arguments pass through."""
+    import aws_cdk_cli.cli
+
+    argv = ["cdk", "--use-bun", "deploy", "--verbose", "--use", "--", "-v"]
+    with (
+        patch("aws_cdk_cli.runtime.run_cdk", return_value=0) as mock_run_cdk,
+        patch("sys.argv", argv),
+        patch.dict(os.environ),
+    ):
+        assert aws_cdk_cli.cli.main() == 0
+        assert os.environ["AWS_CDK_CLI_USE_BUN"] == "1"
+
+    mock_run_cdk.assert_called_once_with(["deploy", "--use", "--", "-v"])
+
+
 def test_wrapper_version():
     """Test that the wrapper version command works."""
     # Mock dependencies
@@ -283,6 +300,194 @@ def test_wrapper_version():
                 sys.stdout = sys.__stdout__
 
 
+def _node_paths(node_bin_path, cdk_script_path):
+    """Return the resolved node paths with the binary and CDK script replaced."""
+    from aws_cdk_cli import _resolve_node_paths
+
+    return _resolve_node_paths()._replace(
+        node_bin_path=node_bin_path,
+        node_bin_dir=os.path.dirname(node_bin_path),
+        cdk_script_path=cdk_script_path,
+    )
+
+
+def test_run_cdk_command_streams_filtered_output(capsys):
+    """Test that CDK output is streamed with upgrade banners removed."""
+    import aws_cdk_cli.cli
+
+    # Use the Python interpreter as a stand-in for "node <cdk script>"
+    script = (
+        "import sys;"
+        "print('synth done');"
+        "print('*** Newer version of CDK is available: npm install -g aws-cdk ***');"
+        "print('warning', file=sys.stderr);"
+        "sys.exit(3)"
+    )
+    with (
+        patch("aws_cdk_cli.cli.is_node_installed", return_value=True),
+        patch(
+            "aws_cdk_cli.cli._resolve_node_paths",
+            return_value=_node_paths(sys.executable, "-c"),
+        ),
+    ):
+        result = aws_cdk_cli.cli.run_cdk_command([script])
+
+    captured = capsys.readouterr()
+    assert result == 3
+    assert captured.out == "synth done\n"
+    assert captured.err == "warning\n"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="exec is POSIX-only")
+def test_run_cdk_command_exec_when_filter_disabled():
+    """Test that Node.js replaces the process when filtering is disabled."""
+    import aws_cdk_cli.cli
+
+    with (
+        patch("aws_cdk_cli.cli.is_node_installed", return_value=True),
+        patch(
+            "aws_cdk_cli.cli._resolve_node_paths",
+            return_value=_node_paths("/opt/node/bin/node", "/opt/cdk/bin/cdk"),
+        ),
+        patch.dict(os.environ, {"AWS_CDK_CLI_DISABLE_UPGRADE_FILTER": "1"}),
+        patch.object(sys.stdout, "isatty", return_value=True),
+        patch("os.execve") as mock_execve,
+        patch("subprocess.Popen") as mock_popen,
+    ):
+        aws_cdk_cli.cli.run_cdk_command(["synth"])
+
+    mock_popen.assert_not_called()
+    path, argv, env = mock_execve.call_args.args
+    assert path == "/opt/node/bin/node"
+    assert argv == ["/opt/node/bin/node", "/opt/cdk/bin/cdk", "synth"]
+    assert env["CDK_DISABLE_VERSION_CHECK"] == "1"
+
+
+def test_run_cdk_command_returns_when_stdout_piped(capsys):
+    """Test that piped output keeps the process even with filtering disabled."""
+    import aws_cdk_cli.cli
+
+    with (
+        patch("aws_cdk_cli.cli.is_node_installed", return_value=True),
+        patch(
+            "aws_cdk_cli.cli._resolve_node_paths",
+            return_value=_node_paths(sys.executable, "-c"),
+        ),
+        patch.dict(os.environ, {"AWS_CDK_CLI_DISABLE_UPGRADE_FILTER": "1"}),
+        patch.object(sys.stdout, "isatty", return_value=False),
+        patch("os.execve") as mock_execve,
+        patch("os.execv") as mock_execv,
+    ):
+        result = aws_cdk_cli.cli.run_cdk_command(["print('synth done')"])
+
+    mock_execve.assert_not_called()
+    mock_execv.assert_not_called()
+    assert result == 0
+    assert capsys.readouterr().out == "synth done\n"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions only")
+@pytest.mark.parametrize(
+    "euid, egid, groups, mode, executable",
+    [
+        (1000, 1000, [], 0o611, False),  # owner without its own exec bit
+        (1000, 1000, [], 0o700, True),
+        (1001, 1000, [], 0o701, False),  # group member without the group bit
+        (1001, 2000, [1000], 0o610, True),  # supplementary group
+        (1001, 2000, [], 0o770, False),  # other without the other bit
+        (1001, 2000, [], 0o601, True),
+        (0, 0, [], 0o010, True),  # root needs any exec bit
+        (0, 0, [], 0o644, False),
+    ],
+)
+def test_stat_exec_checks_bit_of_current_user(euid, egid, groups, mode, executable):
+    """Test that only the exec bit applying to the effective user counts."""
+    from aws_cdk_cli.cli import _stat_exec
+
+    st = os.stat_result((stat.S_IFREG | mode, 0, 0, 1, 1000, 1000, 0, 0, 0, 0))
+    with (
+        patch("os.stat", return_value=st),
+        patch("os.geteuid", return_value=euid),
+        patch("os.getegid", return_value=egid),
+        patch("os.getgroups", return_value=groups),
+    ):
+        assert (_stat_exec("/opt/node/bin/node") is not None) == executable
+
+
+def test_run_cdk_command_inherits_ready_environment():
+    """Test that an already prepared environment is inherited, not copied."""
+    import aws_cdk_cli.cli
+
+    ready_env = {
+        "CDK_DISABLE_VERSION_CHECK": "1",
+        "PATH": aws_cdk_cli.NODE_BIN_DIR + os.pathsep + "/usr/bin",
+    }
+    with (
+        patch("aws_cdk_cli.cli.is_node_installed", return_value=True),
+        patch.dict(os.environ, ready_env),
+        patch("subprocess.run") as mock_run,
+    ):
+        mock_run.return_value = subprocess.CompletedProcess([], 0, "", "")
+        aws_cdk_cli.cli.run_cdk_command(["ls"], capture_output=True)
+        assert mock_run.call_args.kwargs["env"] is None
+
+        aws_cdk_cli.cli.run_cdk_command(
+            ["ls"], capture_output=True, env={"AWS_REGION": "eu-west-1"}
+        )
+        assert mock_run.call_args.kwargs["env"]["AWS_REGION"] == "eu-west-1"
+
+
+def test_run_cdk_command_uses_paths_of_fresh_install():
+    """Test that paths are resolved after an in-process install."""
+    import aws_cdk_cli.cli
+
+    fresh_paths = _node_paths("/fresh/node/bin/node", "/fresh/cdk/bin/cdk")
+    resolved = []
+
+    def resolve():
+        resolved.append(mock_invalidate.called)
+        return fresh_paths
+
+    with (
+        patch("aws_cdk_cli.cli.is_node_installed", return_value=False),
+        patch(
+            "aws_cdk_cli.installer.setup_nodejs", return_value=(True, "/fresh/node")
+        ),
+        patch("aws_cdk_cli.cli.invalidate_runtime_state") as mock_invalidate,
+        patch("aws_cdk_cli.cli._resolve_node_paths", side_effect=resolve),
+        patch("subprocess.run") as mock_run,
+    ):
+        mock_run.return_value = subprocess.CompletedProcess([], 0, "", "")
+        aws_cdk_cli.cli.run_cdk_command(["ls"], capture_output=True)
+
+    assert resolved == [True]
+    assert mock_run.call_args.args[0] == [
+        "/fresh/node/bin/node",
+        "/fresh/cdk/bin/cdk",
+        "ls",
+    ]
+
+
+def test_run_cdk_command_filters_captured_output():
+    """Test that upgrade messages are removed from captured output."""
+    import aws_cdk_cli.cli
+
+    banner = "*** Run npm install -g aws-cdk to upgrade ***"
+    with (
+        patch("aws_cdk_cli.cli.is_node_installed", return_value=True),
+        patch("subprocess.run") as mock_run,
+    ):
+        mock_run.return_value = subprocess.CompletedProcess(
+            [], 0, f"{banner}\nStack A\nStack B\n", f"warning\n{banner}"
+        )
+        assert aws_cdk_cli.cli.run_cdk_command(["ls"], capture_output=True) == (
+            0,
+            "Stack A\nStack B",
+            "warning",
+        )
+    assert mock_run.call_args.kwargs["stdin"] is subprocess.DEVNULL
+
+
 @pytest.mark.integration
 def test_runtime_detection(setup_mock_env):
     """Test runtime detection functions."""
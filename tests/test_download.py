@@ -4,17 +4,25 @@ Unit tests for the download module.
 Tests cover file downloading, error handling, and cleanup.
 """
 
+import hashlib
+import http.client
+import io
 import os
 import tempfile
+import time
 import urllib.error
 from unittest import mock
 
 import pytest
 
 from aws_cdk_cli.download import (
+    COPY_BUFSIZE,
+    DOWNLOAD_TIMEOUT_SECONDS,
     DownloadError,
     download_file,
+    download_file_segmented,
     _cleanup_partial_download,
+    _copy_response,
 )
 
 
@@ -29,7 +37,7 @@ class TestDownloadFile:
 
             # Mock urlopen to return test content
             mock_response = mock.MagicMock()
-            mock_response.read.return_value = test_content
+            mock_response.read.side_effect = [test_content, b""]
             mock_response.__enter__.return_value = mock_response
 
             with mock.patch("urllib.request.urlopen", return_value=mock_response):
@@ -40,6 +48,173 @@ class TestDownloadFile:
             with open(file_path, "rb") as f:
                 assert f.read() == test_content
 
+    def test_download_file_verifies_checksum(self):
+        """Test that the checksum is verified while streaming."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "test_file.txt")
+            test_content = b"Hello, World!"
+            expected = hashlib.sha256(test_content).hexdigest()
+
+            mock_response = mock.MagicMock()
+            mock_response.read.side_effect = [test_content, b""]
+            mock_response.__enter__.return_value = mock_response
+
+            with mock.patch("urllib.request.urlopen", return_value=mock_response):
+                download_file(
+                    "https://example.com/test.txt", file_path, expected_sha256=expected
+                )
+
+            with open(file_path, "rb") as f:
+                assert f.read() == test_content
+
+    def test_download_file_checksum_mismatch(self):
+        """Test that a checksum mismatch raises and removes the file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "test_file.txt")
+
+            mock_response = mock.MagicMock()
+            mock_response.read.side_effect = [b"tampered", b""]
+            mock_response.__enter__.return_value = mock_response
+
+            with (
+                mock.patch("urllib.request.urlopen", return_value=mock_response),
+                pytest.raises(DownloadError) as exc_info,
+            ):
+                download_file(
+                    "https://example.com/test.txt",
+                    file_path,
+                    expected_sha256="0" * 64,
+                )
+
+            assert "Checksum mismatch" in str(exc_info.value)
+            assert not os.path.exists(file_path)
+
+    def test_download_file_resumes_after_network_error(self):
+        """Test that a retry resumes with a Range request."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "test_file.txt")
+            expected = hashlib.sha256(b"Hello, World!").hexdigest()
+
+            interrupted = mock.MagicMock()
+            interrupted.read.side_effect = [b"Hello, ", ConnectionResetError()]
+            interrupted.__enter__.return_value = interrupted
+            resumed = mock.MagicMock(status=206)
+            resumed.read.side_effect = [b"World!", b""]
+            resumed.__enter__.return_value = resumed
+
+            with (
+                mock.patch(
+                    "urllib.request.urlopen", side_effect=[interrupted, resumed]
+                ) as mock_urlopen,
+                mock.patch("time.sleep"),
+            ):
+                download_file(
+                    "https://example.com/test.txt",
+                    file_path,
+                    expected_sha256=expected,
+                    retries=1,
+                )
+
+            request = mock_urlopen.call_args.args[0]
+            assert request.get_header("Range") == "bytes=7-"
+            with open(file_path, "rb") as f:
+                assert f.read() == b"Hello, World!"
+
+    def test_download_file_resumes_partial_file(self):
+        """Test that resume=True continues and keeps an existing partial file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "test_file.txt")
+            with open(file_path, "wb") as f:
+                f.write(b"Hello, ")
+
+            with (
+                mock.patch(
+                    "urllib.request.urlopen",
+                    side_effect=urllib.error.URLError("Network is unreachable"),
+                ),
+                pytest.raises(DownloadError),
+            ):
+                download_file("https://example.com/test.txt", file_path, resume=True)
+            assert os.path.exists(file_path)
+
+            resumed = mock.MagicMock(status=206)
+            resumed.read.side_effect = [b"World!", b""]
+            resumed.__enter__.return_value = resumed
+            with mock.patch(
+                "urllib.request.urlopen", return_value=resumed
+            ) as mock_urlopen:
+                download_file(
+                    "https://example.com/test.txt",
+                    file_path,
+                    expected_sha256=hashlib.sha256(b"Hello, World!").hexdigest(),
+                    resume=True,
+                )
+
+            request = mock_urlopen.call_args.args[0]
+            assert request.get_header("Range") == "bytes=7-"
+            with open(file_path, "rb") as f:
+                assert f.read() == b"Hello, World!"
+
+    def test_download_file_resume_of_complete_file(self):
+        """Test that a complete partial file is accepted on 416 with its size."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "test_file.txt")
+            with open(file_path, "wb") as f:
+                f.write(b"Hello, World!")
+
+            not_satisfiable = urllib.error.HTTPError(
+                "https://example.com/test.txt",
+                416,
+                "Range Not Satisfiable",
+                {"Content-Range": "bytes */13"},
+                None,
+            )
+            with mock.patch(
+                "urllib.request.urlopen", side_effect=not_satisfiable
+            ) as mock_urlopen:
+                download_file(
+                    "https://example.com/test.txt",
+                    file_path,
+                    expected_sha256=hashlib.sha256(b"Hello, World!").hexdigest(),
+                    resume=True,
+                )
+
+            mock_urlopen.assert_called_once()
+            with open(file_path, "rb") as f:
+                assert f.read() == b"Hello, World!"
+
+    def test_download_file_resume_restarts_on_size_mismatch(self):
+        """Test that a 416 for a different remote size restarts from zero."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "test_file.txt")
+            with open(file_path, "wb") as f:
+                f.write(b"Stale content from another release")
+
+            not_satisfiable = urllib.error.HTTPError(
+                "https://example.com/test.txt",
+                416,
+                "Range Not Satisfiable",
+                {"Content-Range": "bytes */13"},
+                None,
+            )
+            fresh = mock.MagicMock(status=200)
+            fresh.read.side_effect = [b"Hello, World!", b""]
+            fresh.__enter__.return_value = fresh
+            with mock.patch(
+                "urllib.request.urlopen", side_effect=[not_satisfiable, fresh]
+            ) as mock_urlopen:
+                download_file(
+                    "https://example.com/test.txt",
+                    file_path,
+                    expected_sha256=hashlib.sha256(b"Hello, World!").hexdigest(),
+                    resume=True,
+                )
+
+            request = mock_urlopen.call_args.args[0]
+            assert request.get_header("Range") is None
+            with open(file_path, "rb") as f:
+                assert f.read() == b"Hello, World!"
+
     def test_download_file_url_error(self):
         """Test that DownloadError is raised on URL error."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -84,7 +259,7 @@ class TestDownloadFile:
 
             # Mock urlopen to succeed but file write to fail
             mock_response = mock.MagicMock()
-            mock_response.read.return_value = b"content"
+            mock_response.read.side_effect = [b"content", b""]
             mock_response.__enter__.return_value = mock_response
 
             with mock.patch("urllib.request.urlopen", return_value=mock_response):
@@ -106,6 +281,126 @@ class TestDownloadFile:
             assert exc_info.value.__cause__ is original_error
 
 
+def _range_server(content, honor_ranges=True):
+    """Build a urlopen replacement that serves content with Range support."""
+
+    def urlopen(request, timeout=None):
+        response = mock.MagicMock()
+        response.__enter__.return_value = response
+        range_header = request.get_header("Range")
+        if honor_ranges and range_header:
+            start, end = map(int, range_header.removeprefix("bytes=").split("-"))
+            body = content[start : end + 1]
+            response.status = 206
+            response.headers = {"Content-Range": f"bytes {start}-{end}/{len(content)}"}
+        else:
+            body = content
+            response.status = 200
+            response.headers = {}
+        response.read = io.BytesIO(body).read
+        return response
+
+    return urlopen
+
+
+class TestDownloadFileSegmented:
+    """Tests for the download_file_segmented function."""
+
+    @pytest.mark.skipif(not hasattr(os, "pwrite"), reason="Requires os.pwrite")
+    def test_downloads_ranges_in_parallel(self, tmp_path):
+        """Test that the file is assembled from several range requests."""
+        content = os.urandom(4 * COPY_BUFSIZE + 5)
+        file_path = str(tmp_path / "node.tar.gz")
+
+        with mock.patch(
+            "urllib.request.urlopen", side_effect=_range_server(content)
+        ) as mock_urlopen:
+            download_file_segmented(
+                "https://example.com/node.tar.gz",
+                file_path,
+                connections=4,
+                expected_sha256=hashlib.sha256(content).hexdigest(),
+            )
+
+        # One probe plus one request per range
+        assert mock_urlopen.call_count == 5
+        for call in mock_urlopen.call_args_list:
+            assert call.kwargs["timeout"] == DOWNLOAD_TIMEOUT_SECONDS
+        with open(file_path, "rb") as f:
+            assert f.read() == content
+
+    def test_falls_back_without_range_support(self, tmp_path):
+        """Test that a server ignoring ranges gets a single-stream download."""
+        content = os.urandom(4 * COPY_BUFSIZE)
+        file_path = str(tmp_path / "node.tar.gz")
+
+        with mock.patch(
+            "urllib.request.urlopen",
+            side_effect=_range_server(content, honor_ranges=False),
+        ) as mock_urlopen:
+            download_file_segmented("https://example.com/node.tar.gz", file_path)
+
+        assert mock_urlopen.call_count == 2
+        for call in mock_urlopen.call_args_list:
+            assert call.kwargs["timeout"] == DOWNLOAD_TIMEOUT_SECONDS
+        with open(file_path, "rb") as f:
+            assert f.read() == content
+
+
+class TestCopyResponse:
+    """Tests for the _copy_response function."""
+
+    def test_copies_all_chunks(self):
+        """Test that every chunk read ahead is written in order."""
+        content = os.urandom(3 * COPY_BUFSIZE + 123)
+        dest = io.BytesIO()
+        sha256 = hashlib.sha256()
+
+        _copy_response(io.BytesIO(content), dest, sha256)
+
+        assert dest.getvalue() == content
+        assert sha256.hexdigest() == hashlib.sha256(content).hexdigest()
+
+    def test_write_errors_propagate(self):
+        """Test that a failing write stops the copy with its error."""
+        dest = mock.MagicMock()
+        dest.write.side_effect = OSError("Disk full")
+
+        with pytest.raises(OSError, match="Disk full"):
+            _copy_response(io.BytesIO(os.urandom(10 * COPY_BUFSIZE)), dest)
+
+    @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+    def test_unexpected_read_error_does_not_hang(self):
+        """Test that a reader dying of an unexpected error ends the copy."""
+        source = mock.MagicMock()
+        source.read.side_effect = ValueError("I/O operation on closed file")
+
+        with pytest.raises(http.client.IncompleteRead):
+            _copy_response(source, io.BytesIO())
+
+    def test_write_error_waits_for_reader(self):
+        """Test that no read is in progress once a failed copy returns."""
+        reads = []
+
+        class SlowSource:
+            def read(self, size):
+                reads.append("start")
+                time.sleep(0.05)
+                reads.append("end")
+                return b"x" * size
+
+        dest = mock.MagicMock()
+        dest.write.side_effect = OSError("Disk full")
+
+        with pytest.raises(OSError, match="Disk full"):
+            _copy_response(SlowSource(), dest)
+
+        assert reads[-1] == "end"
+        count = len(reads)
+        time.sleep(0.1)
+        assert len(reads) == count
+
+
 class TestCleanupPartialDownload:
     """Tests for the _cleanup_partial_download function."""
 
@@ -0,0 +1,440 @@
+"""
+Unit tests for the installer module.
+
+Tests cover version lookup and Node.js download helpers.
+"""
+
+import gzip
+import hashlib
+import io
+import os
+import shutil
+import subprocess
+import tarfile
+import urllib.error
+from unittest import mock
+
+import pytest
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from aws_cdk_cli.constants import ARCHIVE_NAME, NODE_TARBALL_DIR, SYSTEM
+from aws_cdk_cli.installer import (
+    _tmpfs_mount_points,
+    download_node,
+    get_cdk_node_requirements,
+    get_latest_cdk_version,
+    get_nodejs_version,
+    main,
+    verify_node_binary,
+)
+
+
+class TestGetLatestCdkVersion:
+    """Tests for the get_latest_cdk_version function."""
+
+    def test_registry_used_without_spawning_npm(self):
+        """Test that a reachable registry avoids any subprocess."""
+        mock_response = mock.MagicMock()
+        mock_response.read.return_value = b'{"name": "aws-cdk", "version": "2.1.0"}'
+        mock_response.__enter__.return_value = mock_response
+
+        with (
+            mock.patch("urllib.request.urlopen", return_value=mock_response),
+            mock.patch("subprocess.check_output") as mock_check_output,
+        ):
+            assert get_latest_cdk_version() == "2.1.0"
+
+        mock_check_output.assert_not_called()
+
+    def test_falls_back_to_npm_when_offline(self):
+        """Test that npm is used when the registry is unreachable."""
+        with (
+            mock.patch(
+                "urllib.request.urlopen",
+                side_effect=urllib.error.URLError("Network is unreachable"),
+            ),
+            mock.patch("subprocess.check_output", return_value="2.0.0\n"),
+        ):
+            assert get_latest_cdk_version() == "2.0.0"
+
+    def test_returns_none_when_all_sources_fail(self):
+        """Test that None is returned when no source is available."""
+        with (
+            mock.patch(
+                "urllib.request.urlopen",
+                side_effect=urllib.error.URLError("Network is unreachable"),
+            ),
+            mock.patch(
+                "subprocess.check_output",
+                side_effect=subprocess.CalledProcessError(1, "npm"),
+            ),
+        ):
+            assert get_latest_cdk_version() is None
+
+
+def test_cdk_node_requirements_cached_until_package_changes(tmp_path):
+    """Test that package.json is re-read only when its mtime changes."""
+    package_json = tmp_path / "aws-cdk" / "package.json"
+    package_json.parent.mkdir()
+    package_json.write_text('{"engines": {"node": ">= 22.1.0"}}')
+
+    with mock.patch("aws_cdk_cli.installer.NODE_MODULES_DIR", str(tmp_path)):
+        assert get_cdk_node_requirements() == ">= 22.1.0"
+        with mock.patch("aws_cdk_cli.installer._json_loads") as mock_loads:
+            assert get_cdk_node_requirements() == ">= 22.1.0"
+        mock_loads.assert_not_called()
+
+        package_json.write_text('{"engines": {"node": ">= 24.0.0"}}')
+        os.utime(package_json, ns=(1, 1))
+        assert get_cdk_node_requirements() == ">= 24.0.0"
+
+
+def test_downloaded_nodejs_version_read_without_subprocess():
+    """Test that the downloaded Node.js version is known without running it."""
+    with (
+        mock.patch("aws_cdk_cli.installer.NODE_BIN_PATH", "/opt/node/bin/node"),
+        mock.patch("aws_cdk_cli.installer.get_node_version", return_value="22.1.0"),
+        mock.patch("subprocess.run") as mock_run,
+    ):
+        assert get_nodejs_version("/opt/node/bin/node") == "22.1.0"
+    mock_run.assert_not_called()
+
+
+def test_system_nodejs_version_cached_until_binary_changes(tmp_path):
+    """Test that a system Node.js is only probed again after it changes."""
+    node_path = tmp_path / "node"
+    node_path.write_text("")
+    completed = subprocess.CompletedProcess([], 0, stdout="v22.1.0\n", stderr="")
+
+    with mock.patch("subprocess.run", return_value=completed) as mock_run:
+        assert get_nodejs_version(str(node_path)) == "22.1.0"
+        assert get_nodejs_version(str(node_path)) == "22.1.0"
+        assert mock_run.call_count == 1
+
+        os.utime(node_path, ns=(1, 1))
+        assert get_nodejs_version(str(node_path)) == "22.1.0"
+        assert mock_run.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "argv, download_result, expected",
+    [
+        (["--download-node"], (True, "/node"), 0),
+        (["--download-node"], (False, "boom"), 1),
+        (["--check", "--download-node"], None, 1),
+    ],
+)
+def test_main_dispatches_actions(argv, download_result, expected):
+    """Test that the installer CLI runs the requested action."""
+    with (
+        mock.patch("sys.argv", ["installer", *argv]),
+        mock.patch(
+            "aws_cdk_cli.installer.download_node", return_value=download_result
+        ) as mock_download,
+        mock.patch("aws_cdk_cli.installer.is_node_installed", return_value=False),
+    ):
+        assert main() == expected
+    assert mock_download.called == (download_result is not None)
+
+
+def test_main_without_arguments_always_downloads():
+    """Test that the installer downloads Node.js when run without arguments."""
+    with (
+        mock.patch("sys.argv", ["installer"]),
+        mock.patch(
+            "aws_cdk_cli.installer.download_node", return_value=(True, "/node")
+        ) as mock_download,
+        mock.patch("aws_cdk_cli.installer.is_node_installed", return_value=True),
+    ):
+        assert main() == 0
+    mock_download.assert_called_once_with()
+
+
+def test_tmpfs_mount_points_parses_mountinfo():
+    """Test that tmpfs mount points are read from mountinfo."""
+    mountinfo = (
+        "22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw\n"
+        "23 22 0:5 / /dev/shm rw,nosuid shared:2 - tmpfs tmpfs rw\n"
+        "24 22 0:6 / /run/user/1000 rw - tmpfs tmpfs rw,mode=700\n"
+        "25 22 0:7 / /mnt/my\\040disk rw - tmpfs tmpfs rw\n"
+    )
+    with mock.patch("builtins.open", mock.mock_open(read_data=mountinfo)):
+        assert _tmpfs_mount_points() == {"/dev/shm", "/run/user/1000", "/mnt/my disk"}
+
+
+def test_verify_node_binary(tmp_path, monkeypatch):
+    """Test that the archive checksum is compared against the expected one."""
+    monkeypatch.delenv("SKIP_CHECKSUM_VERIFICATION", raising=False)
+    archive = tmp_path / "node.tar.gz"
+    archive.write_bytes(os.urandom(3 * (1 << 20) + 7))
+    expected = hashlib.sha256(archive.read_bytes()).hexdigest()
+
+    assert verify_node_binary(str(archive), expected)
+    assert not verify_node_binary(str(archive), "0" * 64)
+
+
+def _write_node_tarball(path, top_dir=NODE_TARBALL_DIR):
+    """Write a minimal Node.js-like tarball to path."""
+    with tarfile.open(path, "w:gz") as tar:
+        for name, content in [
+            (f"{top_dir}/bin/node", b"#!/bin/sh\n"),
+            (f"{top_dir}/lib/node_modules/npm/package.json", b"{}"),
+            (f"{top_dir}/LICENSE", b"MIT"),
+        ]:
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+
+
+@pytest.mark.skipif(
+    SYSTEM == "windows" or ARCHIVE_NAME is None,
+    reason="Requires a supported Unix platform",
+)
+class TestDownloadNode:
+    """Tests for the download_node function."""
+
+    @pytest.fixture
+    def node_dirs(self, tmp_path):
+        """Point the installer at temporary cache and platform directories."""
+        cache_dir = tmp_path / "cache"
+        platform_dir = tmp_path / "node_binaries"
+        cache_dir.mkdir()
+        node_bin_path = platform_dir / NODE_TARBALL_DIR / "bin" / "node"
+
+        with (
+            mock.patch("aws_cdk_cli.installer.CACHE_DIR", str(cache_dir)),
+            mock.patch(
+                "aws_cdk_cli.installer.get_archive_cache_dir",
+                return_value=str(cache_dir),
+            ),
+            mock.patch("aws_cdk_cli.installer.NODE_PLATFORM_DIR", str(platform_dir)),
+            mock.patch("aws_cdk_cli.installer.NODE_BIN_PATH", str(node_bin_path)),
+        ):
+            yield cache_dir, platform_dir
+
+    def test_extracts_cached_archive(self, node_dirs):
+        """Test that a cached archive is extracted without downloading."""
+        cache_dir, platform_dir = node_dirs
+        _write_node_tarball(cache_dir / ARCHIVE_NAME)
+
+        with (
+            mock.patch("aws_cdk_cli.download.download_file") as mock_download,
+            mock.patch(
+                "aws_cdk_cli.installer.invalidate_runtime_state"
+            ) as mock_invalidate,
+        ):
+            success, node_path = download_node()
+
+        assert success
+        assert node_path == str(platform_dir / NODE_TARBALL_DIR / "bin" / "node")
+        assert os.access(node_path, os.X_OK)
+        assert (
+            platform_dir / NODE_TARBALL_DIR / "lib" / "node_modules" / "npm"
+        ).is_dir()
+        mock_download.assert_not_called()
+        mock_invalidate.assert_called_once()
+
+    def test_extraction_replaces_stale_tree(self, node_dirs):
+        """Test that a previous install is replaced whole, leaving no staging dir."""
+        cache_dir, platform_dir = node_dirs
+        _write_node_tarball(cache_dir / ARCHIVE_NAME)
+        stale_file = platform_dir / NODE_TARBALL_DIR / "stale.txt"
+        stale_file.parent.mkdir(parents=True)
+        stale_file.write_text("left over")
+
+        with mock.patch("aws_cdk_cli.installer.invalidate_runtime_state"):
+            assert download_node()[0]
+
+        assert not stale_file.exists()
+        assert (platform_dir / NODE_TARBALL_DIR / "bin" / "node").is_file()
+        assert sorted(os.listdir(platform_dir)) == [".install-ok", NODE_TARBALL_DIR]
+
+    def test_tmpfs_archive_removed_after_extraction(self, node_dirs, tmp_path):
+        """Test that an archive cached on tmpfs does not outlive the install."""
+        _, platform_dir = node_dirs
+        shm_dir = tmp_path / "shm"
+        shm_dir.mkdir()
+        _write_node_tarball(shm_dir / ARCHIVE_NAME)
+
+        with (
+            mock.patch(
+                "aws_cdk_cli.installer.get_archive_cache_dir",
+                return_value=str(shm_dir),
+            ),
+            mock.patch("aws_cdk_cli.installer.invalidate_runtime_state"),
+        ):
+            assert download_node()[0]
+
+        assert not (shm_dir / ARCHIVE_NAME).exists()
+        assert (platform_dir / NODE_TARBALL_DIR / "bin" / "node").is_file()
+
+    def test_finds_binary_in_unexpected_version_dir(self, node_dirs):
+        """Test that a node-v* directory other than the expected one is found."""
+        cache_dir, platform_dir = node_dirs
+        _write_node_tarball(cache_dir / ARCHIVE_NAME, "node-v0.0.0-custom")
+
+        with mock.patch("aws_cdk_cli.installer.invalidate_runtime_state"):
+            success, node_path = download_node()
+
+        assert success
+        assert node_path == str(platform_dir / "node-v0.0.0-custom" / "bin" / "node")
+
+    def test_verified_download_skips_archive_listing(self, node_dirs):
+        """Test that a checksum-verified download is not listed before extraction."""
+        cache_dir, _ = node_dirs
+
+        def fake_download(url, file_path, **kwargs):
+            _write_node_tarball(file_path)
+
+        with (
+            mock.patch(
+                "aws_cdk_cli.installer._checksum_to_verify", return_value="0" * 64
+            ),
+            mock.patch("aws_cdk_cli.download.download_file", side_effect=fake_download),
+            mock.patch.object(tarfile.TarFile, "getnames") as mock_getnames,
+            mock.patch("aws_cdk_cli.installer.invalidate_runtime_state"),
+        ):
+            assert download_node()[0]
+
+        mock_getnames.assert_not_called()
+        assert (cache_dir / ARCHIVE_NAME).is_file()
+
+    def test_complete_partial_download_published(self, node_dirs):
+        """Test that a fully written .part left by an earlier run is installed."""
+        cache_dir, platform_dir = node_dirs
+        part_file = cache_dir / f"{ARCHIVE_NAME}.part"
+        _write_node_tarball(part_file)
+        data = part_file.read_bytes()
+        not_satisfiable = urllib.error.HTTPError(
+            "https://nodejs.org/dist/node.tar.gz",
+            416,
+            "Range Not Satisfiable",
+            {"Content-Range": f"bytes */{len(data)}"},
+            None,
+        )
+
+        with (
+            mock.patch(
+                "aws_cdk_cli.installer._checksum_to_verify",
+                return_value=hashlib.sha256(data).hexdigest(),
+            ),
+            mock.patch("urllib.request.urlopen", side_effect=not_satisfiable),
+            mock.patch("aws_cdk_cli.installer.invalidate_runtime_state"),
+        ):
+            assert download_node()[0]
+
+        assert (cache_dir / ARCHIVE_NAME).read_bytes() == data
+        assert not part_file.exists()
+        assert (platform_dir / NODE_TARBALL_DIR / "bin" / "node").is_file()
+
+    @pytest.mark.skipif(fcntl is None, reason="Requires fcntl")
+    def test_concurrent_download_uses_private_part_file(self, node_dirs):
+        """Test that the shared .part is not touched while another run owns it."""
+        cache_dir, _ = node_dirs
+        calls = []
+
+        def fake_download(url, file_path, **kwargs):
+            calls.append((file_path, kwargs["resume"]))
+            _write_node_tarball(file_path)
+
+        with (
+            open(cache_dir / f"{ARCHIVE_NAME}.lock", "w") as lock,
+            mock.patch(
+                "aws_cdk_cli.installer._checksum_to_verify", return_value="0" * 64
+            ),
+            mock.patch("aws_cdk_cli.download.download_file", side_effect=fake_download),
+            mock.patch("aws_cdk_cli.installer.invalidate_runtime_state"),
+        ):
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            assert download_node()[0]
+
+        assert calls == [(str(cache_dir / f"{ARCHIVE_NAME}.{os.getpid()}.part"), False)]
+        assert (cache_dir / ARCHIVE_NAME).is_file()
+
+    @pytest.mark.parametrize("valid", [True, False])
+    def test_unverified_download_header_checked(self, node_dirs, valid):
+        """Test that a download without a checksum must look like an archive."""
+        cache_dir, _ = node_dirs
+
+        def fake_download(url, file_path, **kwargs):
+            if valid:
+                _write_node_tarball(file_path)
+            else:
+                with open(file_path, "wb") as f:
+                    f.write(b"<html>Service Unavailable</html>")
+
+        with (
+            mock.patch("aws_cdk_cli.installer._checksum_to_verify", return_value=None),
+            mock.patch("aws_cdk_cli.download.download_file", side_effect=fake_download),
+            mock.patch.object(tarfile.TarFile, "getnames") as mock_getnames,
+            mock.patch("aws_cdk_cli.installer.invalidate_runtime_state"),
+        ):
+            assert download_node()[0] == valid
+
+        mock_getnames.assert_not_called()
+        assert (cache_dir / ARCHIVE_NAME).is_file() == valid
+
+    def test_truncated_cached_archive_discarded(self, node_dirs):
+        """Test that an archive failing extraction is removed from the cache."""
+        cache_dir, platform_dir = node_dirs
+        archive = cache_dir / ARCHIVE_NAME
+        _write_node_tarball(archive)
+        archive.write_bytes(archive.read_bytes()[:40])
+
+        success, error = download_node()
+
+        assert not success
+        assert "Failed to extract" in error
+        assert not archive.exists()
+        assert os.listdir(platform_dir) == []
+
+    def test_extracts_with_parallel_gzip_when_available(self, node_dirs):
+        """Test that rapidgzip is used for decompression when installed."""
+        cache_dir, platform_dir = node_dirs
+        _write_node_tarball(cache_dir / ARCHIVE_NAME)
+        fake_rapidgzip = mock.Mock()
+        fake_rapidgzip.open.side_effect = lambda path, **kwargs: gzip.GzipFile(path)
+
+        with (
+            mock.patch("aws_cdk_cli.installer._rapidgzip", fake_rapidgzip),
+            mock.patch("aws_cdk_cli.installer.invalidate_runtime_state"),
+        ):
+            assert download_node()[0]
+
+        fake_rapidgzip.open.assert_called()
+        assert (platform_dir / NODE_TARBALL_DIR / "bin" / "node").is_file()
+
+    def test_install_marker_skips_extraction(self, node_dirs):
+        """Test that a matching install marker short-circuits re-installs."""
+        cache_dir, _ = node_dirs
+        _write_node_tarball(cache_dir / ARCHIVE_NAME)
+        success, node_path = download_node()
+        assert success
+
+        with mock.patch("tarfile.open") as mock_tar_open:
+            assert download_node() == (True, node_path)
+        mock_tar_open.assert_not_called()
+
+        # Touching the binary invalidates the marker
+        os.utime(node_path, ns=(1, 1))
+        with mock.patch("tarfile.open", wraps=tarfile.open) as mock_tar_open:
+            assert download_node()[0]
+        mock_tar_open.assert_called()
+
+    def test_install_marker_invalidated_by_removed_install(self, node_dirs):
+        """Test that deleting the install makes the next run extract again."""
+        cache_dir, platform_dir = node_dirs
+        _write_node_tarball(cache_dir / ARCHIVE_NAME)
+        success, node_path = download_node()
+        assert success
+        assert (platform_dir / ".install-ok").is_file()
+
+        shutil.rmtree(platform_dir / NODE_TARBALL_DIR)
+        with mock.patch("tarfile.open", wraps=tarfile.open) as mock_tar_open:
+            assert download_node() == (True, node_path)
+        mock_tar_open.assert_called()
+        assert os.path.isfile(node_path)
@@ -11,6 +11,7 @@ import unittest.mock
 import re
 
 from aws_cdk_cli.installer import (
+    extract_min_from_req,
     find_system_nodejs,
     get_nodejs_version,
     get_cdk_node_requirements,
@@ -260,3 +261,20 @@ def test_minimum_node_version_requirement():
     assert min_version >= (22, 0, 0), (
         f"Minimum Node.js version is too low: {min_version}"
     )
+
+
+@pytest.mark.parametrize(
+    "req, expected",
+    [
+        (">= 22.0.0", "22.0.0"),
+        ("^22.1.0", "22.1.0"),
+        ("~22.1.0", "22.1.0"),
+        ("> 22.0.0", "22.0.1"),
+        ("< 24.0.0", None),
+        ("22.1.0 - 24.0.0", "22.1.0"),
+        ("22.1.0", "22.1.0"),
+    ],
+)
+def test_extract_min_from_req(req, expected):
+    """Test that the minimum version is read from each requirement form."""
+    assert extract_min_from_req(req) == expected
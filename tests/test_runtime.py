@@ -0,0 +1,89 @@
+"""
+Unit tests for the runtime module.
+
+Tests cover locating the bundled Node.js binary and caching lookups.
+"""
+
+import os
+
+import pytest
+
+from aws_cdk_cli import _install_cache, _version_from_dir_name
+from aws_cdk_cli.constants import SYSTEM
+from aws_cdk_cli.runtime import find_node_in_directory, iter_candidate_node_paths
+
+unix_layout = pytest.mark.skipif(
+    SYSTEM == "windows", reason="Uses the Unix Node.js layout"
+)
+
+
+def _make_executable(path):
+    """Create an executable file at path, including parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("#!/bin/sh\n")
+    os.chmod(path, 0o755)
+
+
+@unix_layout
+def test_candidates_prefer_versioned_layout(tmp_path):
+    """Test that node-v* directories are yielded before the direct layout."""
+    (tmp_path / "node-v22.0.0-linux-x64").mkdir()
+    (tmp_path / "other").mkdir()
+
+    assert list(iter_candidate_node_paths(str(tmp_path))) == [
+        str(tmp_path / "node-v22.0.0-linux-x64" / "bin" / "node"),
+        str(tmp_path / "bin" / "node"),
+    ]
+
+
+@unix_layout
+def test_candidates_for_missing_directory(tmp_path):
+    """Test that a missing platform directory yields nothing."""
+    assert list(iter_candidate_node_paths(str(tmp_path / "missing"))) == []
+
+
+@unix_layout
+def test_find_node_in_directory(tmp_path):
+    """Test that the first existing executable candidate is returned."""
+    direct = tmp_path / "bin" / "node"
+    _make_executable(direct)
+    assert find_node_in_directory(str(tmp_path)) == str(direct)
+
+    versioned = tmp_path / "node-v22.0.0-linux-x64" / "bin" / "node"
+    _make_executable(versioned)
+    assert find_node_in_directory(str(tmp_path)) == str(versioned)
+
+
+@unix_layout
+def test_find_node_ignores_deeper_layouts(tmp_path):
+    """Test that binaries outside the known layouts are not searched for."""
+    _make_executable(tmp_path / "some" / "nested" / "bin" / "node")
+    assert find_node_in_directory(str(tmp_path)) is None
+
+
+def test_install_cache_can_be_bypassed(monkeypatch):
+    """Test that AWS_CDK_CLI_NO_CACHE disables memoization."""
+    calls = []
+
+    @_install_cache
+    def lookup():
+        calls.append(None)
+        return len(calls)
+
+    assert lookup() == 1
+    assert lookup() == 1
+
+    monkeypatch.setenv("AWS_CDK_CLI_NO_CACHE", "1")
+    assert lookup() == 2
+
+    monkeypatch.delenv("AWS_CDK_CLI_NO_CACHE")
+    lookup.cache_clear()
+    assert lookup() == 3
+
+
+def test_version_from_dir_name():
+    """Test that the Node.js version is read from the archive directory name."""
+    assert _version_from_dir_name("node-v22.22.2-linux-x64") == "22.22.2"
+    assert _version_from_dir_name("node-v22.22.2-win-x64") == "22.22.2"
+    assert _version_from_dir_name("node-vnext-linux-x64") is None
+    assert _version_from_dir_name("bin") is None
@@ -5,153 +5,112 @@ These tests verify that security measures are properly implemented,
 including path traversal protection and input validation.
 """
 
+import io
 import os
-import tempfile
 import tarfile
+from unittest import mock
 
 import pytest
 
-from aws_cdk_cli.installer import PathTraversalError
+from aws_cdk_cli.constants import SYSTEM
+from aws_cdk_cli.installer import PathTraversalError, _safe_extract
+
+
+def _write_tar(tar_path, members):
+    """Write a tar file from (TarInfo, content) pairs."""
+    with tarfile.open(tar_path, "w") as tar:
+        for info, content in members:
+            if content is not None:
+                info.size = len(content)
+                content = io.BytesIO(content)
+            tar.addfile(info, content)
+
+
+def _file(name, content=b"content"):
+    """Return a regular file member for _write_tar."""
+    return tarfile.TarInfo(name), content
+
+
+def _symlink(name, target):
+    """Return a symbolic link member for _write_tar."""
+    info = tarfile.TarInfo(name)
+    info.type = tarfile.SYMTYPE
+    info.linkname = target
+    return info, None
 
 
 class TestPathTraversalProtection:
     """Tests for path traversal attack prevention in archive extraction."""
 
-    def test_is_within_directory_safe_path(self):
-        """Test that safe paths within directory return True."""
-        # Import the function by extracting it from the module
-        # Since it's defined inside download_node, we test the logic directly
-        from pathlib import Path
-
-        def is_within_directory(directory: str, target: str) -> bool:
-            try:
-                abs_directory = Path(directory).resolve()
-                abs_target = Path(target).resolve()
-                abs_target.relative_to(abs_directory)
-                return True
-            except (ValueError, OSError):
-                return False
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Safe: file directly in directory
-            assert is_within_directory(tmpdir, os.path.join(tmpdir, "file.txt"))
-
-            # Safe: file in subdirectory
-            assert is_within_directory(tmpdir, os.path.join(tmpdir, "sub", "file.txt"))
-
-            # Safe: deeply nested
-            assert is_within_directory(
-                tmpdir, os.path.join(tmpdir, "a", "b", "c", "file.txt")
-            )
-
-    def test_is_within_directory_traversal_attack(self):
-        """Test that path traversal attempts are detected."""
-        from pathlib import Path
-
-        def is_within_directory(directory: str, target: str) -> bool:
-            try:
-                abs_directory = Path(directory).resolve()
-                abs_target = Path(target).resolve()
-                abs_target.relative_to(abs_directory)
-                return True
-            except (ValueError, OSError):
-                return False
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Attack: parent directory traversal
-            assert not is_within_directory(tmpdir, os.path.join(tmpdir, "..", "etc", "passwd"))
-
-            # Attack: absolute path outside
-            assert not is_within_directory(tmpdir, "/etc/passwd")
-
-            # Attack: the commonprefix bug case
-            # /tmp/archive vs /tmp/archive-evil/file.txt
-            # commonprefix returns /tmp/archive which LOOKS like it's contained
-            # but it's actually a different directory
-            evil_dir = tmpdir + "-evil"
-            os.makedirs(evil_dir, exist_ok=True)
-            try:
-                evil_file = os.path.join(evil_dir, "malicious.txt")
-                Path(evil_file).touch()
-                # This MUST return False - the old commonprefix implementation
-                # would incorrectly return True here
-                assert not is_within_directory(tmpdir, evil_file), (
-                    "commonprefix bug: directory prefix match should not pass"
-                )
-            finally:
-                import shutil
-                shutil.rmtree(evil_dir, ignore_errors=True)
-
-    def test_is_within_directory_symlink_attack(self):
-        """Test that symlink-based attacks are handled."""
-        from pathlib import Path
-
-        def is_within_directory(directory: str, target: str) -> bool:
-            try:
-                abs_directory = Path(directory).resolve()
-                abs_target = Path(target).resolve()
-                abs_target.relative_to(abs_directory)
-                return True
-            except (ValueError, OSError):
-                return False
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a symlink pointing outside the directory
-            symlink_path = os.path.join(tmpdir, "link")
-            try:
-                os.symlink("/etc", symlink_path)
-                # The resolved path should be /etc/passwd, which is outside tmpdir
-                target = os.path.join(symlink_path, "passwd")
-                assert not is_within_directory(tmpdir, target)
-            except OSError:
-                # Symlink creation may fail on some systems (e.g., Windows without privileges)
-                pytest.skip("Cannot create symlinks on this system")
-
-    def test_malicious_tar_member_rejected(self):
-        """Test that tar files with path traversal members are rejected."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a tar file with a malicious member
-            tar_path = os.path.join(tmpdir, "malicious.tar")
-            extract_dir = os.path.join(tmpdir, "extract")
-            os.makedirs(extract_dir)
-
-            # Create tar with path traversal
-            with tarfile.open(tar_path, "w") as tar:
-                # Create a benign file first
-                benign_file = os.path.join(tmpdir, "benign.txt")
-                with open(benign_file, "w") as f:
-                    f.write("safe content")
-                tar.add(benign_file, arcname="safe.txt")
-
-                # Add a malicious member with path traversal
-                # We need to manually create a TarInfo with a malicious name
-                malicious_info = tarfile.TarInfo(name="../../../etc/evil.txt")
-                malicious_info.size = 12
-                import io
-                tar.addfile(malicious_info, io.BytesIO(b"evil content"))
-
-            # Now test that extraction is blocked
-            # We need to replicate the safe_extract logic
-            from pathlib import Path
-
-            def is_within_directory(directory: str, target: str) -> bool:
-                try:
-                    abs_directory = Path(directory).resolve()
-                    abs_target = Path(target).resolve()
-                    abs_target.relative_to(abs_directory)
-                    return True
-                except (ValueError, OSError):
-                    return False
+    @pytest.fixture
+    def extract(self, tmp_path):
+        """Build a tar from members and extract it with _safe_extract."""
+        extract_dir = tmp_path / "extract"
+        extract_dir.mkdir()
 
+        def run(*members):
+            tar_path = tmp_path / "archive.tar"
+            _write_tar(tar_path, members)
             with tarfile.open(tar_path, "r") as tar:
-                for member in tar.getmembers():
-                    member_path = os.path.join(extract_dir, member.name)
-                    if not is_within_directory(extract_dir, member_path):
-                        # This should trigger for the malicious member
-                        assert "../" in member.name, f"Expected traversal in {member.name}"
-                        break
-                else:
-                    pytest.fail("Malicious tar member was not detected")
+                _safe_extract(tar, str(extract_dir))
+            return extract_dir
+
+        return run
+
+    def test_safe_members_extracted(self, extract):
+        """Test that members inside the directory are extracted."""
+        extract_dir = extract(
+            _file("file.txt"),
+            _file("sub/file.txt"),
+            _file("a/b/c/file.txt"),
+            _symlink("sub/link", "../file.txt"),
+        )
+
+        assert (extract_dir / "file.txt").read_bytes() == b"content"
+        assert (extract_dir / "sub" / "file.txt").is_file()
+        assert (extract_dir / "a" / "b" / "c" / "file.txt").is_file()
+        if SYSTEM != "windows":
+            assert (extract_dir / "sub" / "link").read_bytes() == b"content"
+
+    def test_file_directories_created_once(self, extract, tmp_path):
+        """Test that each file's directory is created once, parents included."""
+        with mock.patch("os.makedirs", wraps=os.makedirs) as mock_makedirs:
+            extract_dir = extract(
+                _file("a/b/one.txt"),
+                _file("a/b/two.txt"),
+                _file("a/three.txt"),
+                _file("c/four.txt"),
+            )
+
+        root = os.path.realpath(extract_dir)
+        created = [os.path.relpath(c.args[0], root) for c in mock_makedirs.mock_calls]
+        # os.makedirs recurses through itself for missing parents
+        assert len(created) == len(set(created))
+        # tarfile never had to create a file's directory itself
+        assert all(c.kwargs.get("exist_ok") for c in mock_makedirs.mock_calls)
+        assert {os.path.join("a", "b"), "c"} <= set(created)
+        assert (extract_dir / "a" / "three.txt").is_file()
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "../../../etc/evil.txt",
+            "/etc/evil.txt",
+            # Same string prefix as the directory, but a sibling of it
+            "../extract-evil/file.txt",
+        ],
+    )
+    def test_traversal_member_rejected(self, extract, name):
+        """Test that members escaping the directory are rejected."""
+        with pytest.raises(PathTraversalError, match="path traversal"):
+            extract(_file("safe.txt"), _file(name, b"evil content"))
+
+    @pytest.mark.parametrize("target", ["/etc", "../../etc", "sub/../.."])
+    def test_symlink_out_of_directory_rejected(self, extract, target, tmp_path):
+        """Test that a link leading outside cannot be written through."""
+        with pytest.raises(PathTraversalError, match="path traversal"):
+            extract(_symlink("link", target), _file("link/passwd", b"evil"))
+        assert not (tmp_path / "passwd").exists()
 
 
 class TestPathTraversalErrorException:
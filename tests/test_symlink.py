@@ -308,3 +308,34 @@ def test_env_var_overrides_system_node(clean_symlink_env):
 
         # Should have created a symlink due to explicit request via env var
         mock_create_symlink.assert_called_once()
+
+
+@pytest.mark.parametrize("link_fails", [False, True])
+def test_windows_links_or_copies_binary(tmp_path, link_fails):
+    """Test that Windows gets a hard link, or a copy, but never a symlink."""
+    node_binary = tmp_path / "node.exe"
+    node_binary.write_bytes(b"MZ")
+    node_binary.chmod(0o755)
+    bin_dir = tmp_path / "Scripts"
+    bin_dir.mkdir()
+    if link_fails:
+        patch_link = patch("os.link", side_effect=OSError("cross-device link"))
+    else:
+        patch_link = patch("os.link", wraps=os.link)
+
+    with (
+        patch("aws_cdk_cli.cli.SYSTEM", "windows"),
+        patch(
+            "aws_cdk_cli.cli._iter_node_binary_candidates",
+            return_value=iter([str(node_binary)]),
+        ),
+        patch("aws_cdk_cli.cli._iter_symlink_dirs", return_value=iter([str(bin_dir)])),
+        patch("os.symlink") as mock_symlink,
+        patch_link,
+    ):
+        assert create_node_symlink()
+
+    mock_symlink.assert_not_called()
+    target = bin_dir / "node.exe"
+    assert target.read_bytes() == b"MZ"
+    assert target.samefile(node_binary) != link_fails